@@ -731,11 +731,12 @@ class AIBrain:
             self.state = "chase"
 
         # Range check (modulated by difficulty accuracy)
-        dist = self._dist(enemy, player)
+        dx = enemy.rect.centerx - player.rect.centerx
+        dy = enemy.rect.centery - player.rect.centery
         effective_reach = reach
         if dfm and dfm.accuracy_mult < 1.0:
             effective_reach *= dfm.accuracy_mult  # worse accuracy = shorter effective reach
-        if dist > effective_reach:
+        if dx * dx + dy * dy > effective_reach * effective_reach:
             self.balancer.record_enemy_miss()
             return 0
 
@@ -26,6 +26,11 @@ _ALL_ARCHETYPES = [
 ]
 
 
+# Stats as last loaded or saved.  This process is the only writer, so
+# later loads reuse it instead of re-reading the file.
+_cached: dict | None = None
+
+
 def _default_entry() -> dict:
     """Return a fresh stats entry for one archetype."""
     return {
@@ -50,7 +55,12 @@ def load_archetype_stats() -> dict:
 
     If the file does not exist or is corrupt, a fresh default
     structure is returned (and written to disk for next time).
+    The file is read once; later calls return the cached dict.
     """
+    global _cached
+    if _cached is not None:
+        return _cached
+
     if not os.path.isfile(_JSON_PATH):
         data = _default_data()
         save_archetype_stats(data)
@@ -73,13 +83,16 @@ def load_archetype_stats() -> dict:
     if changed:
         save_archetype_stats(data)
 
+    _cached = data
     return data
 
 
 def save_archetype_stats(data: dict) -> None:
     """Write the full archetype stats dict to disk."""
+    global _cached
     with open(_JSON_PATH, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
+    _cached = data
 
 
 def update_after_match(
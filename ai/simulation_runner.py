@@ -156,6 +156,9 @@ class SimulationRunner:
                                               player_pers_name, match_start,
                                               p_role_name, e_role_name)
 
+            # Frame timestamp read by the game's AI notifications
+            game._now_s = pygame.time.get_ticks() / 1000.0
+
             # AI-driven player actions
             self._ai_drive_player(raw_dt)
 
@@ -200,6 +203,7 @@ class SimulationRunner:
         game._show_char_select = False
         game.combat.reset()
         game._init_solo()
+        game._retarget()
 
         # Reset VFX / cinematic systems
         from utils.vfx import (
@@ -253,7 +257,6 @@ class SimulationRunner:
         # Consume pending melee damage → resolve via CombatSystem
         pending_dmg = brain.get_pending_damage(player, enemy)
         if pending_dmg > 0:
-            import math
             from settings import ATTACK_RANGE
             # check hitbox or range
             hitbox = player.attack_hitbox
@@ -261,11 +264,9 @@ class SimulationRunner:
             if hitbox is not None:
                 hit_ok = hitbox.colliderect(enemy.rect)
             else:
-                d = math.hypot(
-                    player.rect.centerx - enemy.rect.centerx,
-                    player.rect.centery - enemy.rect.centery,
-                )
-                hit_ok = d <= ATTACK_RANGE
+                dx = player.rect.centerx - enemy.rect.centerx
+                dy = player.rect.centery - enemy.rect.centery
+                hit_ok = dx * dx + dy * dy <= ATTACK_RANGE * ATTACK_RANGE
             if hit_ok:
                 result = game.combat.player_attack(player, enemy)
                 if result.hit and result.damage > 0:
@@ -14,10 +14,6 @@ import time
 
 logger = logging.getLogger(__name__)
 
-import matplotlib
-matplotlib.use("Agg")  # non-interactive backend so the plot doesn't block pygame
-import matplotlib.pyplot as plt
-
 # Aggression snapshot interval (seconds)
 _AGGRESSION_INTERVAL = 10.0
 
@@ -153,6 +149,11 @@ class MatchStats:
         if not self.aggression_history:
             return
 
+        # matplotlib is slow to import, so load it only when a graph is saved
+        import matplotlib
+        matplotlib.use("Agg")  # non-interactive backend so the plot doesn't block pygame
+        import matplotlib.pyplot as plt
+
         x = [i * _AGGRESSION_INTERVAL for i in range(len(self.aggression_history))]
         y = self.aggression_history
 
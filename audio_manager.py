@@ -25,6 +25,7 @@ from settings import SCREEN_WIDTH
 _SAMPLE_RATE = 44100
 _CHANNELS_MIX = 16        # pygame mixer channels to reserve
 _BASE_VOLUME = 0.55        # master volume (0.0 – 1.0)
+_PAN_BUCKET_PX = 64        # queued sfx closer than this play once per frame
 _ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets", "audio")
 
 # ─── Waveform helpers ────────────────────────────────────
@@ -282,6 +283,9 @@ class AudioManager:
         self._current_volume = _BASE_VOLUME
         self._time_scale = 1.0
 
+        # Sounds queued this frame: (name, x_pos, volume_mult)
+        self._pending: list[tuple[str, Optional[float], float]] = []
+
         # Heartbeat (low-HP tension) state
         self._heartbeat_channel: Optional[pygame.mixer.Channel] = None
         self._heartbeat_active = False
@@ -349,6 +353,38 @@ class AudioManager:
         for name in names:
             self.play_sfx(name, x_pos=x_pos, volume_mult=volume_mult)
 
+    # ── Queued playback ───────────────────────────────────
+
+    def queue_sfx(self, name: str, x_pos: Optional[float] = None,
+                  volume_mult: float = 1.0):
+        """Like :meth:`play_sfx`, but deferred to the next :meth:`flush`."""
+        self._pending.append((name, x_pos, volume_mult))
+
+    def queue_layered(self, names: list[str], x_pos: Optional[float] = None,
+                      volume_mult: float = 1.0):
+        """Like :meth:`play_layered`, but deferred to the next :meth:`flush`."""
+        for name in names:
+            self._pending.append((name, x_pos, volume_mult))
+
+    def flush(self):
+        """Play the queued sounds, once per name and pan position.
+
+        Two identical sounds queued in the same frame (e.g. a
+        ``health_tick`` for each of two projectile hits) are played once.
+        """
+        pending = self._pending
+        if not pending:
+            return
+        seen = set()
+        for name, x_pos, volume_mult in pending:
+            key = (name, None if x_pos is None
+                   else round(x_pos / _PAN_BUCKET_PX))
+            if key in seen:
+                continue
+            seen.add(key)
+            self.play_sfx(name, x_pos=x_pos, volume_mult=volume_mult)
+        pending.clear()
+
     # ── Per-frame update ──────────────────────────────────
 
     def update(self, dt: float, time_scale: float,
@@ -507,6 +543,7 @@ class AudioManager:
     def reset(self):
         """Stop all audio and reset state.  Call on match restart."""
         pygame.mixer.stop()
+        self._pending.clear()
         self._heartbeat_active = False
         self._heartbeat_channel = None
         self._ambient_active = False
@@ -15,6 +15,7 @@ Dependencies: opencv-python, numpy, scipy, pygame
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
 from pathlib import Path
@@ -30,15 +31,29 @@ if TYPE_CHECKING:
     import numpy as np
     from scipy.spatial import Delaunay
 
-# Heavy deps imported lazily — game still works if not installed
-try:
-    import cv2
-    import numpy as np
-    from scipy.spatial import Delaunay
-    _HAS_DEPS = True
-except ImportError as _exc:
-    _HAS_DEPS = False
-    _MISSING_MSG = str(_exc)
+# Heavy deps imported lazily (first generate(), see _load_deps) so startup
+# doesn't pay for them — game still works if not installed
+_HAS_DEPS = all(
+    importlib.util.find_spec(_mod) is not None
+    for _mod in ("cv2", "numpy", "scipy")
+)
+_MISSING_MSG = "" if _HAS_DEPS else "opencv-python, numpy or scipy not found"
+_deps_loaded = False
+
+
+def _load_deps() -> bool:
+    """Import cv2 / numpy / scipy into this module on first call."""
+    global cv2, np, Delaunay, _HAS_DEPS, _MISSING_MSG, _deps_loaded
+    if _HAS_DEPS and not _deps_loaded:
+        try:
+            import cv2
+            import numpy as np
+            from scipy.spatial import Delaunay
+            _deps_loaded = True
+        except ImportError as exc:
+            _HAS_DEPS = False
+            _MISSING_MSG = str(exc)
+    return _deps_loaded
 
 # ── Cache directory for generated avatars ─────────────────
 _CACHE_DIR = Path(__file__).resolve().parent / ".avatar_cache"
@@ -73,7 +88,7 @@ class PolyFaceGenerator:
     def generate(self) -> pygame.Surface | None:
         """Run the full pipeline.  Returns a circular Pygame surface
         ready for blitting, or *None* on any failure."""
-        if not _HAS_DEPS:
+        if not _load_deps():
             logger.warning("Missing dependency: %s", _MISSING_MSG)
             logger.warning("Install with: pip install opencv-python numpy scipy")
             return None
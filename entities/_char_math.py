@@ -0,0 +1,54 @@
+"""
+_char_math.py – Numeric per-frame kinematics for characters.
+
+Display-position lerp, knockback decay and clamped movement are pure
+scalar math, so they are compiled with numba when it is installed.
+Without numba the same functions run as plain Python – behaviour is
+identical either way.
+"""
+
+from __future__ import annotations
+
+from utils.jit import njit
+
+
+@njit(cache=True)
+def step_motion(rect_x: int, rect_y: int,
+                display_x: float, display_y: float,
+                knockback_vx: float, knockback_vy: float,
+                dt: float, lerp: float):
+    """Advance smoothed display position and knockback by one frame.
+
+    Returns ``(display_x, display_y, knockback_vx, knockback_vy, dx, dy)``
+    where *dx*/*dy* are the whole-pixel knockback moves to add to the rect.
+    """
+    display_x += (rect_x - display_x) * lerp
+    display_y += (rect_y - display_y) * lerp
+
+    if abs(knockback_vx) > 0.1 or abs(knockback_vy) > 0.1:
+        dx = int(knockback_vx * dt * 60)
+        dy = int(knockback_vy * dt * 60)
+        knockback_vx *= 0.85
+        knockback_vy *= 0.85
+    else:
+        dx = 0
+        dy = 0
+        knockback_vx = 0.0
+        knockback_vy = 0.0
+    return display_x, display_y, knockback_vx, knockback_vy, dx, dy
+
+
+@njit(cache=True)
+def clamp_move(x: int, y: int, dx: int, dy: int, max_x: int, max_y: int):
+    """Return ``(x + dx, y + dy)`` clamped to ``[0, max_x] × [0, max_y]``."""
+    x += dx
+    y += dy
+    if x < 0:
+        x = 0
+    elif x > max_x:
+        x = max_x
+    if y < 0:
+        y = 0
+    elif y > max_y:
+        y = max_y
+    return x, y
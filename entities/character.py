@@ -18,6 +18,7 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+import numpy as np
 import pygame
 from settings import (
     CHAR_WIDTH, CHAR_HEIGHT, ARENA_FLOOR_Y, SCREEN_WIDTH, SCREEN_HEIGHT,
@@ -25,6 +26,7 @@ from settings import (
     MELEE_HITBOX_WIDTH, MELEE_HITBOX_HEIGHT, MELEE_HITBOX_OFFSET_X,
     ATTACK_ACTIVE_START, ATTACK_ACTIVE_END,
 )
+from entities._char_math import step_motion
 
 
 # ══════════════════════════════════════════════════════════
@@ -37,7 +39,7 @@ class BodyPart:
     __slots__ = (
         "name", "surface", "anchor_x", "anchor_y",
         "offset_x", "offset_y", "rotation", "scale",
-        "base_offset_x", "base_offset_y", "visible",
+        "base_offset_x", "base_offset_y", "_visible", "owner",
     )
 
     def __init__(self, name: str, surface: pygame.Surface,
@@ -52,29 +54,59 @@ class BodyPart:
         self.offset_y = 0.0
         self.rotation = 0.0            # degrees
         self.scale = 1.0
-        self.visible = True
+        self._visible = True
+        self.owner: Character | None = None  # notified on visibility change
+
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool):
+        if value != self._visible:
+            self._visible = value
+            if self.owner is not None:
+                self.owner._active_parts = None
+                self.owner._block_render_cache.clear()
 
     def reset_transform(self):
-        self.offset_x = 0.0
-        self.offset_y = 0.0
-        self.rotation = 0.0
+        self.offset_x = self.offset_y = self.rotation = 0.0
         self.scale = 1.0
 
-    def get_rendered(self) -> tuple[pygame.Surface, tuple[int, int]]:
-        """Return (transformed_surface, blit_position) relative to char origin."""
-        if not self.visible:
-            return pygame.Surface((0, 0), pygame.SRCALPHA), (0, 0)
+    def get_rendered(self, alpha: int = 255
+                     ) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Return (transformed_surface, blit_position) relative to char origin.
 
+        *alpha* < 255 starts from a cached translucent copy of the part;
+        the surface alpha carries through scale/rotate, so no per-frame
+        copy is needed.  Scale and rotation are quantised (see
+        ``_XFORM_CACHE``) so repeated poses reuse earlier transforms.
+        Hidden parts are filtered out by the caller.
+        """
         surf = self.surface
-        # Apply scale
-        if abs(self.scale - 1.0) > 0.01:
-            w = max(1, int(surf.get_width() * self.scale))
-            h = max(1, int(surf.get_height() * self.scale))
-            surf = pygame.transform.scale(surf, (w, h))
-
-        # Apply rotation
-        if abs(self.rotation) > 0.5:
-            surf = pygame.transform.rotate(surf, self.rotation)
+        if alpha < 255:
+            surf = _alpha_variant(surf, alpha)
+
+        scale_q = round(self.scale * _SCALE_STEPS)
+        rot = round(self.rotation)
+        if scale_q != _SCALE_STEPS or rot:
+            key = (surf, scale_q, rot)
+            xf = _XFORM_CACHE.get(key)
+            if xf is None:
+                if len(_XFORM_CACHE) >= _XFORM_CACHE_MAX:
+                    _XFORM_CACHE.clear()
+                xf = surf
+                # Apply scale
+                if scale_q != _SCALE_STEPS:
+                    scale = scale_q / _SCALE_STEPS
+                    w = max(1, int(surf.get_width() * scale))
+                    h = max(1, int(surf.get_height() * scale))
+                    xf = pygame.transform.scale(xf, (w, h))
+                # Apply rotation
+                if rot:
+                    xf = pygame.transform.rotate(xf, rot)
+                _XFORM_CACHE[key] = xf
+            surf = xf
 
         # Compute blit position
         bx = self.base_offset_x + int(self.offset_x) - surf.get_width() // 2
@@ -82,21 +114,64 @@ class BodyPart:
         return surf, (bx, by)
 
 
+# Transformed part surfaces keyed by (surface, scale step, whole degrees).
+# Poses are quantised to 1/_SCALE_STEPS scale and integer-degree rotation,
+# which is invisible at pixel-art resolution and keeps the key space small
+# enough that steady-state play never calls transform.scale/rotate.
+# Emptied when full so surfaces of discarded parts don't live forever.
+_SCALE_STEPS = 20
+_XFORM_CACHE_MAX = 2048
+_XFORM_CACHE: dict[tuple[pygame.Surface, int, int], pygame.Surface] = {}
+
+# Translucent copies of part surfaces, keyed by (surface, alpha).
+# Emptied when full so surfaces of discarded parts don't live forever.
+_ALPHA_CACHE_MAX = 256
+_ALPHA_CACHE: dict[tuple[pygame.Surface, int], pygame.Surface] = {}
+
+
+def _alpha_variant(surf: pygame.Surface, alpha: int) -> pygame.Surface:
+    key = (surf, alpha)
+    variant = _ALPHA_CACHE.get(key)
+    if variant is None:
+        if len(_ALPHA_CACHE) >= _ALPHA_CACHE_MAX:
+            _ALPHA_CACHE.clear()
+        variant = surf.copy()
+        variant.set_alpha(alpha)
+        _ALPHA_CACHE[key] = variant
+    return variant
+
+
 # ══════════════════════════════════════════════════════════
 #  Pixel Sprite Builder
 # ══════════════════════════════════════════════════════════
 
-def _make_surface(w: int, h: int) -> pygame.Surface:
-    return pygame.Surface((w, h), pygame.SRCALPHA)
+def _pixels_to_surface(pixel_data: list[str],
+                       palette: dict[str, tuple]) -> pygame.Surface:
+    """Rasterise rows of palette chars into a new per-pixel-alpha surface.
 
+    The rows are turned into an index grid and gathered through an RGBA
+    palette table in one NumPy call; unmapped chars stay transparent.
+    """
+    width = max(len(row) for row in pixel_data)
+    chars = np.array([list(row.ljust(width)) for row in pixel_data])
+    symbols, indices = np.unique(chars, return_inverse=True)
+    table = np.zeros((len(symbols), 4), np.uint8)
+    for i, ch in enumerate(symbols):
+        color = palette.get(ch)
+        if color is not None:
+            table[i] = (*color[:3], color[3] if len(color) > 3 else 255)
+    rgba = table[indices.reshape(chars.shape)]
+    return pygame.image.frombytes(rgba.tobytes(), (width, len(pixel_data)),
+                                  "RGBA")
 
-def _fill_pixels(surf: pygame.Surface, pixel_data: list[str],
-                 palette: dict[str, tuple]) -> None:
-    """Fill surface from a list of strings where each char maps to a color."""
-    for y, row in enumerate(pixel_data):
-        for x, ch in enumerate(row):
-            if ch in palette:
-                surf.set_at((x, y), palette[ch])
+
+# (surface, anchor_x, anchor_y, base_offset_x, base_offset_y) per part name
+PartSpec = tuple[pygame.Surface, int, int, int, int]
+
+# Finished part surfaces keyed by (base, accent, skin, facing).  Only the
+# immutable surfaces are shared – every Character still gets its own
+# BodyPart instances because those carry per-frame transform state.
+_PARTS_SURF_CACHE: dict[tuple, dict[str, PartSpec]] = {}
 
 
 def build_knight_parts(base_color: tuple, accent_color: tuple,
@@ -113,6 +188,40 @@ def build_knight_parts(base_color: tuple, accent_color: tuple,
 
     Returns dict of BodyPart keyed by name.
     """
+    specs = _build_knight_surfaces(base_color, accent_color,
+                                   skin_color, facing)
+    parts: dict[str, BodyPart] = {}
+    for name, (surf, ax, ay, box, boy) in specs.items():
+        part = BodyPart(name, surf, anchor_x=ax, anchor_y=ay)
+        part.base_offset_x = box
+        part.base_offset_y = boy
+        parts[name] = part
+    return parts
+
+
+def _build_knight_surfaces(base_color: tuple, accent_color: tuple,
+                           skin_color: tuple = (230, 190, 155),
+                           facing: int = 1) -> dict[str, PartSpec]:
+    """Return the (cached) part surfaces and placement for one knight."""
+    key = (tuple(base_color), tuple(accent_color), tuple(skin_color), facing)
+    cached = _PARTS_SURF_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    if facing == -1:
+        # Left-facing parts are the right-facing ones mirrored about the
+        # sprite's centre line – no need to re-rasterise the pixel data.
+        right = _build_knight_surfaces(base_color, accent_color,
+                                       skin_color, facing=1)
+        mid = CHAR_WIDTH // 2
+        specs = {
+            name: (pygame.transform.flip(surf, True, False),
+                   surf.get_width() - ax, ay, 2 * mid - box, boy)
+            for name, (surf, ax, ay, box, boy) in right.items()
+        }
+        _PARTS_SURF_CACHE[key] = specs
+        return specs
+
     dark = tuple(max(0, c - 50) for c in base_color)
     light = tuple(min(255, c + 40) for c in base_color)
     metal = (180, 190, 200)
@@ -143,12 +252,9 @@ def build_knight_parts(base_color: tuple, accent_color: tuple,
         "m": metal, "M": metal_dark, "v": visor,
         "S": skin_color, ".": (0, 0, 0, 0),
     }
-    head_surf = _make_surface(12, 12)
-    _fill_pixels(head_surf, head_data, head_pal)
-    head = BodyPart("head", pygame.transform.scale(head_surf, (20, 20)),
-                    anchor_x=10, anchor_y=16)
-    head.base_offset_x = CHAR_WIDTH // 2
-    head.base_offset_y = 6
+    head_surf = _pixels_to_surface(head_data, head_pal)
+    head = (pygame.transform.scale(head_surf, (20, 20)),
+            10, 16, CHAR_WIDTH // 2, 6)
 
     # ── BODY (16×18) ─────────────────────────────────────
     body_data = [
@@ -175,12 +281,9 @@ def build_knight_parts(base_color: tuple, accent_color: tuple,
         "B": base_color, "A": accent_color, "d": dark,
         "c": light, ".": (0, 0, 0, 0),
     }
-    body_surf = _make_surface(16, 18)
-    _fill_pixels(body_surf, body_data, body_pal)
-    body = BodyPart("body", pygame.transform.scale(body_surf, (28, 34)),
-                    anchor_x=14, anchor_y=4)
-    body.base_offset_x = CHAR_WIDTH // 2
-    body.base_offset_y = 22
+    body_surf = _pixels_to_surface(body_data, body_pal)
+    body = (pygame.transform.scale(body_surf, (28, 34)),
+            14, 4, CHAR_WIDTH // 2, 22)
 
     # ── ARM (weapon side, 6×14) ──────────────────────────
     arm_data = [
@@ -202,13 +305,9 @@ def build_knight_parts(base_color: tuple, accent_color: tuple,
     arm_pal = {
         "B": base_color, "S": skin_color, ".": (0, 0, 0, 0),
     }
-    arm_surf = _make_surface(6, 14)
-    _fill_pixels(arm_surf, arm_data, arm_pal)
-    weapon_arm = BodyPart("weapon_arm",
-                          pygame.transform.scale(arm_surf, (10, 22)),
-                          anchor_x=5, anchor_y=4)
-    weapon_arm.base_offset_x = CHAR_WIDTH // 2 + 16 * facing
-    weapon_arm.base_offset_y = 20
+    arm_surf = _pixels_to_surface(arm_data, arm_pal)
+    weapon_arm = (pygame.transform.scale(arm_surf, (10, 22)),
+                  5, 4, CHAR_WIDTH // 2 + 16 * facing, 20)
 
     # ── WEAPON (sword, 4×20) ─────────────────────────────
     sword_data = [
@@ -237,13 +336,9 @@ def build_knight_parts(base_color: tuple, accent_color: tuple,
         "W": blade, "E": blade_edge, "H": hilt,
         "h": (100, 70, 30), ".": (0, 0, 0, 0),
     }
-    sword_surf = _make_surface(4, 20)
-    _fill_pixels(sword_surf, sword_data, sword_pal)
-    weapon = BodyPart("weapon",
-                      pygame.transform.scale(sword_surf, (8, 36)),
-                      anchor_x=4, anchor_y=28)
-    weapon.base_offset_x = CHAR_WIDTH // 2 + 22 * facing
-    weapon.base_offset_y = 16
+    sword_surf = _pixels_to_surface(sword_data, sword_pal)
+    weapon = (pygame.transform.scale(sword_surf, (8, 36)),
+              4, 28, CHAR_WIDTH // 2 + 22 * facing, 16)
 
     # ── SHIELD (off-hand, 8×12) ──────────────────────────
     shield_data = [
@@ -264,21 +359,19 @@ def build_knight_parts(base_color: tuple, accent_color: tuple,
         "r": shield_rim, "F": shield_face, "A": accent_color,
         ".": (0, 0, 0, 0),
     }
-    shield_surf = _make_surface(8, 12)
-    _fill_pixels(shield_surf, shield_data, shield_pal)
-    shield = BodyPart("shield",
-                      pygame.transform.scale(shield_surf, (14, 22)),
-                      anchor_x=7, anchor_y=4)
-    shield.base_offset_x = CHAR_WIDTH // 2 - 18 * facing
-    shield.base_offset_y = 22
-
-    return {
+    shield_surf = _pixels_to_surface(shield_data, shield_pal)
+    shield = (pygame.transform.scale(shield_surf, (14, 22)),
+              7, 4, CHAR_WIDTH // 2 - 18 * facing, 22)
+
+    specs = {
         "head": head,
         "body": body,
         "weapon_arm": weapon_arm,
         "weapon": weapon,
         "shield": shield,
     }
+    _PARTS_SURF_CACHE[key] = specs
+    return specs
 
 
 # ══════════════════════════════════════════════════════════
@@ -308,10 +401,38 @@ class AnimState:
         self.timer = 0.0
 
 
+# Sine lookup table for the idle sway – a sub-pixel error is invisible
+# on a 1.5 px breath, and a table index beats a libm call per part.
+_SIN_LUT_SIZE = 1024
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+_SIN_LUT = [math.sin(i / _SIN_LUT_SCALE) for i in range(_SIN_LUT_SIZE)]
+_SIN_LUT_ARR = np.array(_SIN_LUT)
+
+
+def _fast_sin(x: float) -> float:
+    return _SIN_LUT[int(x * _SIN_LUT_SCALE) & (_SIN_LUT_SIZE - 1)]
+
+
+def _fast_sin_array(x: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`_fast_sin` (same table, same results)."""
+    idx = (x * _SIN_LUT_SCALE).astype(np.int64) & (_SIN_LUT_SIZE - 1)
+    return _SIN_LUT_ARR[idx]
+
+
+def _shift_parts(parts: dict[str, BodyPart], dx: float = 0.0,
+                 dy: float = 0.0):
+    """Move every part by the same offset (whole-sprite knockback/sink)."""
+    for part in parts.values():
+        part.offset_x += dx
+        part.offset_y += dy
+
+
 def apply_idle_animation(parts: dict[str, BodyPart], t: float):
     """Gentle breathing + weapon sway."""
-    breath = math.sin(t * 2.5) * 1.5
-    sway = math.sin(t * 1.8) * 2.0
+    _pose_idle(parts, _fast_sin(t * 2.5) * 1.5, _fast_sin(t * 1.8) * 2.0)
+
+
+def _pose_idle(parts: dict[str, BodyPart], breath: float, sway: float):
     parts["head"].offset_y = breath * 0.6
     parts["body"].offset_y = breath
     parts["weapon_arm"].offset_y = breath * 0.8
@@ -369,16 +490,13 @@ def apply_hurt_animation(parts: dict[str, BodyPart], progress: float,
     if progress < 0.4:
         frac = progress / 0.4
         knockback = 6 * frac
-        for part in parts.values():
-            part.offset_x += -knockback * facing
         parts["body"].rotation = -8 * frac * facing
         parts["head"].offset_y = -3 * frac
     else:
         frac = (progress - 0.4) / 0.6
         knockback = 6 * (1.0 - frac)
-        for part in parts.values():
-            part.offset_x += -knockback * facing
         parts["body"].rotation = -8 * (1 - frac) * facing
+    _shift_parts(parts, dx=-knockback * facing)
 
 
 def apply_death_animation(parts: dict[str, BodyPart], progress: float,
@@ -387,9 +505,10 @@ def apply_death_animation(parts: dict[str, BodyPart], progress: float,
     tilt = min(1.0, progress * 1.5) * 80 * facing
     sink = min(1.0, progress) * 20
     alpha_mult = max(0.0, 1.0 - progress * 0.6)
+    body_tilt = tilt * 0.3
     for part in parts.values():
-        part.rotation = tilt * 0.3
-        part.offset_y += sink
+        part.rotation = body_tilt
+    _shift_parts(parts, dy=sink)
     parts["weapon"].offset_x = 10 * progress * facing
     parts["weapon"].rotation = tilt * 0.8
 
@@ -398,6 +517,15 @@ def apply_death_animation(parts: dict[str, BodyPart], progress: float,
 #  Character Base Class
 # ══════════════════════════════════════════════════════════
 
+# Largest on-screen rect.x / rect.y (see clamp_to_screen)
+_MAX_RECT_X = SCREEN_WIDTH - CHAR_WIDTH
+_MAX_RECT_Y = SCREEN_HEIGHT - CHAR_HEIGHT
+
+_DISPLAY_LERP = 0.18   # per-frame smoothing of display toward rect position
+
+_DRAW_ORDER = ("body", "shield", "weapon_arm", "weapon", "head")
+
+
 class Character:
     """Pixel-based combat character with modular body parts,
     procedural animation, stamina, and state machine.
@@ -405,9 +533,34 @@ class Character:
     Subclass for Player / Enemy specifics.
     """
 
+    __slots__ = (
+        "rect", "facing", "base_color", "accent_color", "parts",
+        "_draw_parts", "_active_parts", "_block_render_cache",
+        "display_x", "display_y", "max_hp", "hp",
+        "stamina", "max_stamina", "stamina_component", "buff_manager",
+        "is_attacking", "is_blocking", "is_dodging", "is_stunned",
+        "stun_timer", "is_invincible",
+        "dodge_timer", "dodge_dir", "dodge_cooldown_timer",
+        "anim_state", "anim_timer", "_global_timer", "_idle_pose_pending",
+        "_last_attack_time", "attack_duration", "hurt_duration",
+        "death_duration", "active_buffs", "damage_mult",
+        "base_speed", "speed", "avatar_surface",
+        "_knockback_vx", "_knockback_vy", "_invuln_timer", "_invuln_duration",
+        "_attack_hitbox", "_attack_hitbox_rect", "_hitbox_hit_targets",
+    )
+
+    # Static overlays shared by every character (built on first use)
+    _SHADOW_SURF: pygame.Surface | None = None
+    _STAR_SURFS: dict[tuple[int, ...], pygame.Surface] = {}
+
     def __init__(self, x: int, y: int, base_color: tuple,
                  accent_color: tuple, facing: int = 1,
                  max_hp: int = 120):
+        if Character._SHADOW_SURF is None:
+            shadow = pygame.Surface((CHAR_WIDTH + 6, 8), pygame.SRCALPHA)
+            pygame.draw.ellipse(shadow, (0, 0, 0, 60), shadow.get_rect())
+            Character._SHADOW_SURF = shadow
+
         # Position / collision
         self.rect = pygame.Rect(x, y, CHAR_WIDTH, CHAR_HEIGHT)
         self.facing = facing           # 1 = right, -1 = left
@@ -416,6 +569,18 @@ class Character:
         self.base_color = base_color
         self.accent_color = accent_color
         self.parts = build_knight_parts(base_color, accent_color, facing=facing)
+        for part in self.parts.values():
+            part.owner = self
+        # Parts in draw order (the parts dict is kept for name lookups)
+        self._draw_parts: tuple[BodyPart, ...] = tuple(
+            self.parts[name] for name in _DRAW_ORDER
+        )
+        # Visible subset of _draw_parts; None = rebuild on next draw
+        self._active_parts: tuple[BodyPart, ...] | None = None
+        # Rendered block pose per facing (see _block_render)
+        self._block_render_cache: dict[int, list] = {}
+        # Warm the opposite facing too so the first turn never stalls
+        _build_knight_surfaces(base_color, accent_color, facing=-facing)
 
         # Display position (smooth interpolation)
         self.display_x = float(x)
@@ -448,6 +613,7 @@ class Character:
         self.anim_state = "idle"       # idle | attack | block | hurt | death
         self.anim_timer = 0.0
         self._global_timer = 0.0       # for idle animation
+        self._idle_pose_pending = False  # idle pose deferred to tick_all_idles
         self._last_attack_time = 0.0
         self.attack_duration = 0.35    # seconds per attack animation
         self.hurt_duration = 0.3
@@ -476,6 +642,9 @@ class Character:
 
         # Melee hitbox (active only during attack active frames)
         self._attack_hitbox: pygame.Rect | None = None
+        self._attack_hitbox_rect = pygame.Rect(
+            0, 0, MELEE_HITBOX_WIDTH, MELEE_HITBOX_HEIGHT,
+        )  # reused every active frame; _attack_hitbox points here or is None
         self._hitbox_hit_targets: set[int] = set()  # prevent multi-hit per swing
 
     # ── Properties ────────────────────────────────────────
@@ -500,6 +669,14 @@ class Character:
         """True during dodge i-frames OR post-hit i-frames."""
         return self.is_invincible or self._invuln_timer > 0
 
+    @property
+    def stamina_fraction(self) -> float:
+        """Stamina as 0-1, read from the stamina component when attached."""
+        comp = self.stamina_component
+        if comp is not None:
+            return comp.stamina / max(1, comp.max_stamina)
+        return self.stamina / max(1, self.max_stamina)
+
     @property
     def attack_hitbox(self) -> pygame.Rect | None:
         """Active melee hitbox rect, or None if not currently in active frames."""
@@ -507,25 +684,26 @@ class Character:
 
     # ── Core update (call each frame) ─────────────────────
 
-    def update_animation(self, dt: float):
-        """Advance animation timers and apply procedural transforms."""
+    def update_animation(self, dt: float, pose_idle: bool = True):
+        """Advance animation timers and apply procedural transforms.
+
+        Pass ``pose_idle=False`` when the caller batches the idle pose for
+        several characters through :meth:`tick_all_idles`.
+        """
         self._global_timer += dt
         self.anim_timer += dt
 
-        # Smooth display position
-        lerp = 0.18
-        self.display_x += (self.rect.x - self.display_x) * lerp
-        self.display_y += (self.rect.y - self.display_y) * lerp
-
-        # Knockback decay
-        if abs(self._knockback_vx) > 0.1 or abs(self._knockback_vy) > 0.1:
-            self.rect.x += int(self._knockback_vx * dt * 60)
-            self.rect.y += int(self._knockback_vy * dt * 60)
-            self._knockback_vx *= 0.85
-            self._knockback_vy *= 0.85
-        else:
-            self._knockback_vx = 0.0
-            self._knockback_vy = 0.0
+        # Smooth display position + knockback decay
+        rect = self.rect
+        (self.display_x, self.display_y,
+         self._knockback_vx, self._knockback_vy,
+         dx, dy) = step_motion(
+            rect.x, rect.y, self.display_x, self.display_y,
+            self._knockback_vx, self._knockback_vy, float(dt), _DISPLAY_LERP,
+        )
+        if dx or dy:
+            rect.x += dx
+            rect.y += dy
 
         # Invulnerability frame timer
         if self._invuln_timer > 0:
@@ -549,9 +727,12 @@ class Character:
         if self.dodge_cooldown_timer > 0:
             self.dodge_cooldown_timer -= dt
 
-        # Reset all transforms
-        for part in self.parts.values():
-            part.reset_transform()
+        # Reset all transforms (inlined reset_transform – hot loop).
+        # The block pose is static and rendered from a cache in draw().
+        if self.anim_state != "block":
+            for part in self.parts.values():
+                part.offset_x = part.offset_y = part.rotation = 0.0
+                part.scale = 1.0
 
         # Apply state-specific animation
         if self.anim_state == "death":
@@ -566,7 +747,7 @@ class Character:
                 # Safety: ensure attack flag is cleared after hurt
                 self.is_attacking = False
         elif self.anim_state == "block":
-            apply_block_animation(self.parts, self.facing)
+            pass  # see _block_render()
         elif self.anim_state == "attack":
             progress = min(1.0, self.anim_timer / self.attack_duration)
             apply_attack_animation(self.parts, progress, self.facing)
@@ -574,10 +755,10 @@ class Character:
             if ATTACK_ACTIVE_START <= progress <= ATTACK_ACTIVE_END:
                 hx = self.rect.centerx + (MELEE_HITBOX_OFFSET_X * self.facing)
                 hy = self.rect.centery - MELEE_HITBOX_HEIGHT // 2
-                self._attack_hitbox = pygame.Rect(
-                    hx - MELEE_HITBOX_WIDTH // 2, hy,
-                    MELEE_HITBOX_WIDTH, MELEE_HITBOX_HEIGHT,
-                )
+                hitbox = self._attack_hitbox_rect
+                hitbox.x = hx - MELEE_HITBOX_WIDTH // 2
+                hitbox.y = hy
+                self._attack_hitbox = hitbox
             else:
                 self._attack_hitbox = None
             if self.anim_timer >= self.attack_duration:
@@ -588,10 +769,41 @@ class Character:
                 self._hitbox_hit_targets.clear()
         else:
             # idle
-            apply_idle_animation(self.parts, self._global_timer)
-
-        # Clamp to screen
-        self.rect.clamp_ip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+            if pose_idle:
+                apply_idle_animation(self.parts, self._global_timer)
+            else:
+                self._idle_pose_pending = True
+
+        self.clamp_to_screen()
+
+    def clamp_to_screen(self) -> None:
+        """Keep the rect fully on screen (no temporary Rect per call)."""
+        rect = self.rect
+        x = rect.x
+        if x < 0:
+            rect.x = 0
+        elif x > _MAX_RECT_X:
+            rect.x = _MAX_RECT_X
+        y = rect.y
+        if y < 0:
+            rect.y = 0
+        elif y > _MAX_RECT_Y:
+            rect.y = _MAX_RECT_Y
+
+    @staticmethod
+    def tick_all_idles(chars) -> None:
+        """Apply the idle pose to every character left pending by
+        ``update_animation(dt, pose_idle=False)``, evaluating the breath
+        and sway waves for all of them in one vectorised lookup each."""
+        idle = [c for c in chars if c._idle_pose_pending]
+        if not idle:
+            return
+        ts = np.fromiter((c._global_timer for c in idle), float, len(idle))
+        breath = (_fast_sin_array(ts * 2.5) * 1.5).tolist()
+        sway = (_fast_sin_array(ts * 1.8) * 2.0).tolist()
+        for c, b, sw in zip(idle, breath, sway):
+            _pose_idle(c.parts, b, sw)
+            c._idle_pose_pending = False
 
     # ── Actions ───────────────────────────────────────────
 
@@ -680,9 +892,18 @@ class Character:
             self._rebuild_parts()
 
     def _rebuild_parts(self):
-        self.parts = build_knight_parts(
+        """Point the existing parts at the cached surfaces for the current
+        facing (the parts dict and BodyPart objects are kept)."""
+        specs = _build_knight_surfaces(
             self.base_color, self.accent_color, facing=self.facing,
         )
+        for name, (surf, ax, ay, box, boy) in specs.items():
+            part = self.parts[name]
+            part.surface = surf
+            part.anchor_x = ax
+            part.anchor_y = ay
+            part.base_offset_x = box
+            part.base_offset_y = boy
 
     # ── Drawing ───────────────────────────────────────────
 
@@ -691,11 +912,9 @@ class Character:
         ox = int(self.display_x)
         oy = int(self.display_y)
 
+        # Everything is queued and handed to SDL in a single blits() call
         # Shadow ellipse
-        shadow_w, shadow_h = CHAR_WIDTH + 6, 8
-        shadow_surf = pygame.Surface((shadow_w, shadow_h), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (0, 0, 0, 60), shadow_surf.get_rect())
-        surface.blit(shadow_surf, (ox - 3, oy + CHAR_HEIGHT - 3))
+        blit_seq = [(Character._SHADOW_SURF, (ox - 3, oy + CHAR_HEIGHT - 3))]
 
         # Stun visual: yellow tint overlay
         tint = None
@@ -704,29 +923,54 @@ class Character:
         # Dodge visual: ghost alpha
         dodge_alpha = 120 if self.is_dodging else 255
 
-        # Composite body parts (order: shadow, body, head, arms, weapon, shield)
-        draw_order = ["body", "shield", "weapon_arm", "weapon", "head"]
-        for part_name in draw_order:
-            part = self.parts.get(part_name)
-            if part is None or not part.visible:
-                continue
-            rendered, (bx, by) = part.get_rendered()
-            if rendered.get_width() == 0:
-                continue
-
-            if dodge_alpha < 255:
-                rendered = rendered.copy()
-                rendered.set_alpha(dodge_alpha)
-
-            surface.blit(rendered, (ox + bx, oy + by))
+        # Composite body parts (order: shadow, body, shield, arm, weapon, head)
+        active = self._active_parts
+        if active is None:
+            active = self._active_parts = tuple(
+                part for part in self._draw_parts if part.visible
+            )
+        if self.anim_state == "block":
+            # The cached pose is used while dodging too, just made translucent
+            for rendered, (bx, by) in self._block_render(active):
+                if dodge_alpha != 255:
+                    rendered = _alpha_variant(rendered, dodge_alpha)
+                blit_seq.append((rendered, (ox + bx, oy + by)))
+        else:
+            for part in active:
+                rendered, (bx, by) = part.get_rendered(dodge_alpha)
+                blit_seq.append((rendered, (ox + bx, oy + by)))
 
         # Stun sparkle
         if self.is_stunned and self._global_timer % 0.3 < 0.15:
-            star_surf = pygame.Surface((CHAR_WIDTH, 6), pygame.SRCALPHA)
-            for i in range(3):
-                sx = 8 + i * 14 + int(math.sin(self._global_timer * 5 + i) * 3)
-                pygame.draw.circle(star_surf, (255, 255, 100, 200), (sx, 3), 2)
-            surface.blit(star_surf, (ox, oy - 8))
+            t = self._global_timer * 5
+            jitter = tuple(int(math.sin(t + i) * 3) for i in range(3))
+            star_surf = Character._STAR_SURFS.get(jitter)
+            if star_surf is None:
+                star_surf = pygame.Surface((CHAR_WIDTH, 6), pygame.SRCALPHA)
+                for i, dx in enumerate(jitter):
+                    sx = 8 + i * 14 + dx
+                    pygame.draw.circle(star_surf, (255, 255, 100, 200), (sx, 3), 2)
+                Character._STAR_SURFS[jitter] = star_surf
+            blit_seq.append((star_surf, (ox, oy - 8)))
+
+        self._overlay_blits(blit_seq, ox, oy)
+        surface.blits(blit_seq, doreturn=False)
+
+    def _overlay_blits(self, blit_seq: list, ox: int, oy: int) -> None:
+        """Hook for subclasses to queue extra blits drawn on top of the
+        character in the same ``blits()`` call (origin *ox*, *oy*)."""
+
+    def _block_render(self, active: tuple[BodyPart, ...]
+                      ) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """Rendered parts for the (constant) block pose, cached per facing."""
+        cached = self._block_render_cache.get(self.facing)
+        if cached is None:
+            for part in self.parts.values():
+                part.reset_transform()
+            apply_block_animation(self.parts, self.facing)
+            cached = [part.get_rendered() for part in active]
+            self._block_render_cache[self.facing] = cached
+        return cached
 
     # ── Serialization helpers ─────────────────────────────
 
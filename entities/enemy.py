@@ -24,13 +24,12 @@ logger = logging.getLogger(__name__)
 
 import pygame
 from settings import (
-    SCREEN_WIDTH, SCREEN_HEIGHT,
     RED, ENEMY_SPEED, ENEMY_MAX_HP,
     ENEMY_START_X, ENEMY_START_Y,
     GREEN, SMALL_FONT_SIZE,
     ENEMY_REGEN_INTERVAL, ENEMY_REGEN_MIN_PCT, ENEMY_REGEN_MAX_PCT,
     ENEMY_REGEN_CAP_PCT, ENEMY_REGEN_IDLE_MS,
-    ENEMY_REGEN_FLASH_DUR, ENEMY_REGEN_TEXT_DUR,
+    ENEMY_REGEN_FLASH_DUR, ENEMY_REGEN_TEXT_DUR, ENEMY_REGEN_CHECK_DT,
     STAMINA_MAX,
     DUELIST_HP_MULT,
 )
@@ -39,11 +38,64 @@ from systems.stamina_system import StaminaComponent
 from systems.buff_system import BuffManager
 from ai.ai_system import select_personality
 from ai.ai_core import AIBrain
+from utils.vfx import draw_glow
+from systems.regen_jit import compute_regen
+
+
+# Regen label font + rendered text (cached after first use)
+_regen_font = None
+_regen_text_surf = None
+
+def _regen_text_surface():
+    """Return the pre-rendered "Regenerating…" label."""
+    global _regen_font, _regen_text_surf
+    if _regen_text_surf is None:
+        if _regen_font is None:
+            _regen_font = pygame.font.SysFont(None, SMALL_FONT_SIZE)
+        _regen_text_surf = _regen_font.render("Regenerating\u2026", True, GREEN)
+    return _regen_text_surf
+
+
+class _FakePlayer:
+    """Minimal player stand-in for callers that pass only a rect."""
+
+    __slots__ = ("rect", "is_attacking", "is_blocking", "can_act",
+                 "stamina_component")
+
+    def __init__(self):
+        self.rect = None
+        self.is_attacking = False
+        self.is_blocking = False
+        self.can_act = True
+        self.stamina_component = None
+
+
+class _RegenState:
+    """Enemy regeneration bookkeeping, kept in one slotted object."""
+
+    __slots__ = ("last", "idle_since", "active", "vis_timer",
+                 "text_timer", "text_y", "accum")
+
+    def __init__(self):
+        self.last = 0             # ms tick of the last heal
+        self.idle_since = 0       # ms tick the player last acted
+        self.active = False       # glow on
+        self.vis_timer = 0.0      # seconds of glow left
+        self.text_timer = 0.0     # seconds of floating text left
+        self.text_y = 0.0         # floating text rise (px)
+        self.accum = 0.0          # time since last eligibility check
 
 
 class Enemy(Character):
     """AI-controlled enemy with personality and adaptive behavior."""
 
+    __slots__ = (
+        "player_style", "build_type", "personality", "archetype",
+        "ai_controller", "clock_dt", "_fake_player",
+        "state", "last_attack_type", "_was_combo",
+        "_regen", "_regen_cap_hp", "_regen_min_amt", "_regen_max_amt",
+    )
+
     def __init__(self, player_style: str = "Unknown",
                  build_type: str = "BALANCED"):
         super().__init__(
@@ -77,23 +129,28 @@ class Enemy(Character):
             scaled_hp = int(ENEMY_MAX_HP * DUELIST_HP_MULT)
             self.max_hp = scaled_hp
             self.hp = scaled_hp
-            logger.info("Duelist HP scaled to %d", scaled_hp)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Duelist HP scaled to %d", scaled_hp)
 
         # Delta time (seconds)
         self.clock_dt = 1.0 / 60.0
 
+        # Stand-in target for the legacy rect-only update() call
+        self._fake_player = _FakePlayer()
+
         # Legacy compat for match stats
         self.state = "chase"
         self.last_attack_type: str | None = None
         self._was_combo = False
 
         # Regeneration state
-        self._last_regen_time = 0
-        self._player_idle_since = 0
-        self._is_regenerating = False
-        self._regen_visual_timer = 0.0
-        self._regen_text_timer = 0.0
-        self._regen_text_y_offset = 0.0
+        self._regen = _RegenState()
+        self._refresh_regen_limits()
+
+    @property
+    def is_regenerating(self) -> bool:
+        """True while the regen glow is showing."""
+        return self._regen.active
 
     # ── AI Update ─────────────────────────────────────────
 
@@ -110,37 +167,40 @@ class Enemy(Character):
         if dt is None:
             dt = self.clock_dt
 
+        # Dead: no AI or regen, just play out the death animation
+        if not self.alive:
+            self.update_animation(dt)
+            return
+
         now = pygame.time.get_ticks()
+        regen = self._regen
 
         # Track player activity for regen
         if player_is_active:
-            self._player_idle_since = now
+            regen.idle_since = now
 
-        # Regen
-        self._try_regenerate(now)
+        # Regen (checked on a fixed tick; its gates are seconds long)
+        regen.accum += dt
+        if regen.accum >= ENEMY_REGEN_CHECK_DT:
+            regen.accum = 0.0
+            self._try_regenerate(now)
 
         # Visual timers
-        if self._regen_visual_timer > 0:
-            self._regen_visual_timer -= dt
-            if self._regen_visual_timer <= 0:
-                self._is_regenerating = False
-        if self._regen_text_timer > 0:
-            self._regen_text_timer -= dt
-            self._regen_text_y_offset += 20 * dt
+        if regen.vis_timer > 0:
+            regen.vis_timer -= dt
+            if regen.vis_timer <= 0:
+                regen.active = False
+        if regen.text_timer > 0:
+            regen.text_timer -= dt
+            regen.text_y += 20 * dt
 
         # AI brain drives movement + attack decisions
-        if hasattr(player_rect_or_char, 'rect'):
+        if getattr(player_rect_or_char, 'rect', None) is not None:
             self.ai_controller.update(self, player_rect_or_char, dt)
         else:
             # Legacy: passed a rect directly
-            class _FakePlayer:
-                def __init__(self, rect):
-                    self.rect = rect
-                    self.is_attacking = False
-                    self.is_blocking = False
-                    self.can_act = True
-                    self.stamina_component = None
-            fake = _FakePlayer(player_rect_or_char)
+            fake = self._fake_player
+            fake.rect = player_rect_or_char
             self.ai_controller.update(self, fake, dt)
 
         # Sync legacy state
@@ -151,7 +211,7 @@ class Enemy(Character):
         self.update_animation(dt)
 
         # Clamp
-        self.rect.clamp_ip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.clamp_to_screen()
 
     def try_attack(self, player_rect) -> int:
         """Legacy API – returns damage dealt. Used by old CombatSystem."""
@@ -160,32 +220,41 @@ class Enemy(Character):
 
     # ── Regeneration ──────────────────────────────────────
 
+    def _refresh_regen_limits(self):
+        """Recompute the HP-derived regen bounds (call if max_hp changes)."""
+        self._regen_cap_hp = int(self.max_hp * ENEMY_REGEN_CAP_PCT)
+        self._regen_min_amt = int(self.max_hp * ENEMY_REGEN_MIN_PCT)
+        self._regen_max_amt = int(self.max_hp * ENEMY_REGEN_MAX_PCT)
+
     def _try_regenerate(self, now: int):
+        regen = self._regen
         if self.state == "attack":
             return
-        if now - self._last_regen_time < ENEMY_REGEN_INTERVAL:
+        if now - regen.last < ENEMY_REGEN_INTERVAL:
             return
-        if now - self._player_idle_since < ENEMY_REGEN_IDLE_MS:
+        if now - regen.idle_since < ENEMY_REGEN_IDLE_MS:
             return
-        cap_hp = self.max_hp * ENEMY_REGEN_CAP_PCT
-        if self.hp >= cap_hp:
+        new_hp, healed = compute_regen(
+            self.hp, self._regen_cap_hp,
+            self._regen_min_amt, self._regen_max_amt, random.random(),
+        )
+        if not healed:
             return
-        heal_pct = random.uniform(ENEMY_REGEN_MIN_PCT, ENEMY_REGEN_MAX_PCT)
-        heal_amount = int(self.max_hp * heal_pct)
-        self.hp = min(int(cap_hp), self.hp + heal_amount)
-        self._last_regen_time = now
-        self._is_regenerating = True
-        self._regen_visual_timer = ENEMY_REGEN_FLASH_DUR
-        self._regen_text_timer = ENEMY_REGEN_TEXT_DUR
-        self._regen_text_y_offset = 0.0
+        self.hp = new_hp
+        regen.last = now
+        regen.active = True
+        regen.vis_timer = ENEMY_REGEN_FLASH_DUR
+        regen.text_timer = ENEMY_REGEN_TEXT_DUR
+        regen.text_y = 0.0
 
     # ── Draw override ─────────────────────────────────────
 
     def draw(self, surface: pygame.Surface, dt: float = 0.016):
         """Render with regen glow if active."""
+        regen = self._regen
+
         # Regen glow
-        if self._is_regenerating:
-            from utils.vfx import draw_glow
+        if regen.active:
             glow_x = int(self.display_x) + self.rect.width // 2
             glow_y = int(self.display_y) + self.rect.height // 2
             draw_glow(surface, (glow_x, glow_y), 45, (50, 200, 50))
@@ -193,14 +262,13 @@ class Enemy(Character):
         super().draw(surface, dt)
 
         # Floating regen text
-        if self._regen_text_timer > 0:
-            alpha_frac = min(1.0, self._regen_text_timer / ENEMY_REGEN_TEXT_DUR)
-            font = pygame.font.SysFont(None, SMALL_FONT_SIZE)
-            txt = font.render("Regenerating\u2026", True, GREEN)
-            alpha_surf = pygame.Surface(txt.get_size(), pygame.SRCALPHA)
-            alpha_surf.blit(txt, (0, 0))
-            alpha_surf.set_alpha(int(255 * alpha_frac))
+        if regen.text_timer > 0:
+            alpha_frac = min(1.0, regen.text_timer / ENEMY_REGEN_TEXT_DUR)
+            # Per-pixel-alpha text also honours surface alpha, so fade the
+            # shared label directly instead of copying it every frame
+            txt = _regen_text_surface()
+            txt.set_alpha(int(255 * alpha_frac))
             tx = int(self.display_x) + self.rect.width // 2 - txt.get_width() // 2
-            ty = int(self.display_y) - 20 - int(self._regen_text_y_offset)
-            surface.blit(alpha_surf, (tx, ty))
+            ty = int(self.display_y) - 20 - int(regen.text_y)
+            surface.blit(txt, (tx, ty))
 
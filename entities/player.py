@@ -4,7 +4,6 @@ player.py – Player entity built on the Character pixel sprite system.
 Controls: Arrow keys (move), Space (attack), LShift (block), Z (dodge)
 """
 
-import time
 import pygame
 from settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT, BLUE,
@@ -14,15 +13,26 @@ from settings import (
     STAMINA_MAX,
 )
 from entities.character import Character
+from entities._char_math import clamp_move
 from systems.stamina_system import StaminaComponent
 from systems.buff_system import BuffManager
 from systems.ability_system import Ability, create_ability
 from keybinds import SOLO_KEYS
 
+# Block drain step when the caller doesn't supply a frame dt
+_BLOCK_FALLBACK_DT = 1.0 / 60.0
+
 
 class Player(Character):
     """Player-controlled pixel knight."""
 
+    __slots__ = (
+        "attack_cooldown_ms", "last_attack_time",
+        "_scaled_avatar", "_scaled_avatar_src",
+        "role_config", "role_name", "role_damage_mult", "role_defense_mult",
+        "ability", "_k_left", "_k_right", "_k_up", "_k_down",
+    )
+
     def __init__(self, role_config: dict | None = None):
         super().__init__(
             x=PLAYER_START_X,
@@ -34,8 +44,9 @@ class Player(Character):
         )
         self.base_speed = PLAYER_SPEED
         self.speed = PLAYER_SPEED
-        self.last_attack_time = 0.0
-        self.attack_cooldown = PLAYER_ATTACK_COOLDOWN
+        # Attack cooldown in pygame ticks (ms), same clock as the enemy AI
+        self.attack_cooldown_ms = int(PLAYER_ATTACK_COOLDOWN * 1000)
+        self.last_attack_time = -self.attack_cooldown_ms
 
         # Stamina component
         self.stamina_component = StaminaComponent(STAMINA_MAX)
@@ -47,6 +58,9 @@ class Player(Character):
 
         # Avatar head (None = use default pixel sprite)
         self.avatar_surface: pygame.Surface | None = None
+        # Head-sized copy of avatar_surface, rebuilt when the avatar changes
+        self._scaled_avatar: pygame.Surface | None = None
+        self._scaled_avatar_src: pygame.Surface | None = None
 
         # Role config (from CharacterSelectScreen)
         self.role_config: dict | None = role_config
@@ -57,6 +71,16 @@ class Player(Character):
         if role_config:
             self._apply_role(role_config)
 
+        # Movement key codes (cached from SOLO_KEYS, see rebind)
+        self.rebind()
+
+    def rebind(self) -> None:
+        """Refresh the cached movement keys after SOLO_KEYS changes."""
+        self._k_left = SOLO_KEYS["move_left"]
+        self._k_right = SOLO_KEYS["move_right"]
+        self._k_up = SOLO_KEYS["move_up"]
+        self._k_down = SOLO_KEYS["move_down"]
+
     def _apply_role(self, cfg: dict) -> None:
         """Override base stats from a role config dict."""
         self.role_name = cfg.get("name", "Default")
@@ -86,28 +110,28 @@ class Player(Character):
         if self.buff_manager:
             speed = self.buff_manager.modify_speed(speed)
 
-        if keys[SOLO_KEYS["move_left"]]:
-            self.rect.x -= int(speed)
-        if keys[SOLO_KEYS["move_right"]]:
-            self.rect.x += int(speed)
-        if keys[SOLO_KEYS["move_up"]]:
-            self.rect.y -= int(speed)
-        if keys[SOLO_KEYS["move_down"]]:
-            self.rect.y += int(speed)
+        # Key states are 0/1, so each axis is a single signed step
+        step = int(speed)
+        dx = step * (keys[self._k_right] - keys[self._k_left])
+        dy = step * (keys[self._k_down] - keys[self._k_up])
 
         # Dodge movement
         if self.is_dodging:
-            self.rect.x += self.dodge_dir * DODGE_SPEED
+            dx += self.dodge_dir * DODGE_SPEED
 
-        # Clamp
-        self.rect.clamp_ip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Move + clamp to screen in one step, one Rect write
+        rect = self.rect
+        rect.topleft = clamp_move(
+            rect.x, rect.y, dx, dy,
+            SCREEN_WIDTH - rect.width, SCREEN_HEIGHT - rect.height,
+        )
 
     # ── Attack ────────────────────────────────────────────
 
     def try_attack(self) -> bool:
         """Attempt attack. Returns True if attack fires."""
-        now = time.time()
-        cd = self.attack_cooldown
+        now = pygame.time.get_ticks()
+        cd = self.attack_cooldown_ms
         if self.buff_manager:
             cd = self.buff_manager.modify_attack_cooldown(cd)
 
@@ -126,14 +150,17 @@ class Player(Character):
 
     # ── Block (held key) ──────────────────────────────────
 
-    def try_block(self, pressed: bool):
-        """Start or stop blocking based on key state."""
+    def try_block(self, pressed: bool, dt: float = _BLOCK_FALLBACK_DT):
+        """Start or stop blocking based on key state.
+
+        *dt* is the frame delta used for the per-second block stamina drain.
+        """
         if pressed and self.can_act:
             if not self.is_blocking:
                 self.start_block()
                 return True
             # Drain stamina while blocking
-            self.stamina_component.drain_block(1 / 60)
+            self.stamina_component.drain_block(dt)
         else:
             if self.is_blocking:
                 self.stop_block()
@@ -148,9 +175,9 @@ class Player(Character):
         if not self.stamina_component.drain_dodge():
             return False
         # Direction based on movement keys
-        if keys[SOLO_KEYS["move_left"]]:
+        if keys[self._k_left]:
             direction = -1
-        elif keys[SOLO_KEYS["move_right"]]:
+        elif keys[self._k_right]:
             direction = 1
         else:
             direction = -self.facing  # dodge backward
@@ -166,17 +193,17 @@ class Player(Character):
 
     # ── Draw override ─────────────────────────────────────
 
-    def draw(self, surface: pygame.Surface, dt: float = 0.016):
-        """Render player. Uses avatar_surface for head if available."""
-        super().draw(surface, dt)
-
-        # If avatar surface is set, overlay it as head
-        if self.avatar_surface is not None and self.alive:
-            head_size = min(20, self.avatar_surface.get_width())
-            head = pygame.transform.smoothscale(
-                self.avatar_surface, (head_size, head_size),
-            )
-            hx = int(self.display_x) + self.rect.width // 2 - head_size // 2
-            hy = int(self.display_y) - 2
-            surface.blit(head, (hx, hy))
+    def _overlay_blits(self, blit_seq: list, ox: int, oy: int) -> None:
+        """Overlay avatar_surface as the head, if one is set."""
+        avatar = self.avatar_surface
+        if avatar is not None and self.alive:
+            if self._scaled_avatar_src is not avatar:
+                size = min(20, avatar.get_width())
+                self._scaled_avatar = pygame.transform.smoothscale(
+                    avatar, (size, size),
+                )
+                self._scaled_avatar_src = avatar
+            head = self._scaled_avatar
+            hx = ox + self.rect.width // 2 - head.get_width() // 2
+            blit_seq.append((head, (hx, oy - 2)))
 
@@ -16,16 +16,19 @@ Usage:
         ...
 
 Persistence:
+    init_keybinds()   – load controls.json once (call after pygame.init)
     save_keybinds()   – write current bindings to controls.json
-    load_keybinds()   – load from controls.json (called on import)
+    load_keybinds()   – load from controls.json
     reset_keybinds()  – restore factory defaults
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
+from typing import Callable
 
 import pygame
 
@@ -112,39 +115,73 @@ SOLO_KEYS: dict[str, int] = dict(_DEFAULT_SOLO)
 PVP_P1_KEYS: dict[str, int] = dict(_DEFAULT_PVP_P1)
 PVP_P2_KEYS: dict[str, int] = dict(_DEFAULT_PVP_P2)
 
+# Reverse indices: key code → actions bound to it.  Kept in sync by
+# set_binding() / _reindex(); more than one action means a conflict.
+SOLO_REV: dict[int, list[str]] = {}
+PVP_P1_REV: dict[int, list[str]] = {}
+PVP_P2_REV: dict[int, list[str]] = {}
+
+# Per-tab lookups for the controls menu (tab index → set)
+_ALL_BINDINGS = (SOLO_KEYS, PVP_P1_KEYS, PVP_P2_KEYS)
+_ALL_DEFAULTS = (_DEFAULT_SOLO, _DEFAULT_PVP_P1, _DEFAULT_PVP_P2)
+
+_LIVE_SETS = (
+    (SOLO_KEYS, SOLO_REV),
+    (PVP_P1_KEYS, PVP_P1_REV),
+    (PVP_P2_KEYS, PVP_P2_REV),
+)
+
 
 # ══════════════════════════════════════════════════════════
 #  Persistence helpers
 # ══════════════════════════════════════════════════════════
 
-def save_keybinds() -> None:
-    """Persist current bindings to controls.json."""
+def save_keybinds(pretty: bool = False) -> None:
+    """Persist current bindings to controls.json.
+
+    Written to a temporary file and renamed into place, so a crash
+    mid-write never leaves a truncated controls.json behind.  The file
+    is machine-managed and stored compactly; *pretty* indents it for
+    hand inspection.
+    """
+    # json.dump only reads the mappings, so the live dicts go in as-is
     payload = {
-        "solo": {action: key for action, key in SOLO_KEYS.items()},
-        "pvp_p1": {action: key for action, key in PVP_P1_KEYS.items()},
-        "pvp_p2": {action: key for action, key in PVP_P2_KEYS.items()},
+        "solo": SOLO_KEYS,
+        "pvp_p1": PVP_P1_KEYS,
+        "pvp_p2": PVP_P2_KEYS,
     }
+    tmp_path = _CONTROLS_PATH + ".tmp"
     try:
-        with open(_CONTROLS_PATH, "w", encoding="utf-8") as fp:
-            json.dump(payload, fp, indent=2)
+        with open(tmp_path, "w", encoding="utf-8") as fp:
+            if pretty:
+                json.dump(payload, fp, indent=2)
+            else:
+                json.dump(payload, fp, separators=(",", ":"))
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, _CONTROLS_PATH)
         logger.info("Keybinds saved to %s", _CONTROLS_PATH)
     except OSError as exc:
         logger.error("Failed to save keybinds: %s", exc)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 
 def load_keybinds() -> None:
     """Load bindings from controls.json into the live dictionaries.
 
     Missing actions are filled from defaults.  Unknown actions are
-    silently ignored so a hand-edited JSON won't crash the game.
+    silently ignored so a hand-edited JSON won't crash the game, and
+    values that aren't valid pygame key codes fall back to the default.
     """
-    if not os.path.exists(_CONTROLS_PATH):
-        logger.info("No controls.json found – using defaults.")
-        return
-
     try:
         with open(_CONTROLS_PATH, "r", encoding="utf-8") as fp:
             data = json.load(fp)
+    except FileNotFoundError:
+        logger.info("No controls.json found – using defaults.")
+        return
     except (OSError, json.JSONDecodeError) as exc:
         logger.warning("Could not read controls.json (%s) – using defaults.", exc)
         return
@@ -152,22 +189,53 @@ def load_keybinds() -> None:
     def _apply(target: dict[str, int], section: str, defaults: dict[str, int]):
         raw = data.get(section, {})
         for action in ACTIONS:
+            code = defaults[action]
             if action in raw:
-                target[action] = int(raw[action])
-            else:
-                target[action] = defaults[action]
+                # key_name() is '' for unknown codes (and warms its cache)
+                try:
+                    candidate = int(raw[action])
+                    valid = bool(key_name(candidate))
+                except (TypeError, ValueError, OverflowError):
+                    valid = False
+                if valid:
+                    code = candidate
+                else:
+                    logger.warning("Ignoring invalid key %r for %s.%s",
+                                   raw[action], section, action)
+            target[action] = code
 
     _apply(SOLO_KEYS, "solo", _DEFAULT_SOLO)
     _apply(PVP_P1_KEYS, "pvp_p1", _DEFAULT_PVP_P1)
     _apply(PVP_P2_KEYS, "pvp_p2", _DEFAULT_PVP_P2)
+    _reindex_all()
     logger.info("Keybinds loaded from %s", _CONTROLS_PATH)
 
 
+_loaded = False
+
+
+def init_keybinds() -> None:
+    """Load the saved bindings on first call; later calls do nothing.
+
+    Importing this module does no disk I/O – the game calls this during
+    start-up, and the controls menu calls it defensively on entry.
+    """
+    global _loaded
+    if not _loaded:
+        _loaded = True
+        load_keybinds()
+
+
 def reset_keybinds() -> None:
-    """Restore factory defaults and save."""
+    """Restore factory defaults and save (no write if already default)."""
+    if (SOLO_KEYS == _DEFAULT_SOLO and PVP_P1_KEYS == _DEFAULT_PVP_P1
+            and PVP_P2_KEYS == _DEFAULT_PVP_P2):
+        logger.info("Keybinds already at defaults.")
+        return
     SOLO_KEYS.update(_DEFAULT_SOLO)
     PVP_P1_KEYS.update(_DEFAULT_PVP_P1)
     PVP_P2_KEYS.update(_DEFAULT_PVP_P2)
+    _reindex_all()
     save_keybinds()
     logger.info("Keybinds reset to defaults.")
 
@@ -176,24 +244,57 @@ def reset_keybinds() -> None:
 #  Conflict detection
 # ══════════════════════════════════════════════════════════
 
+def _reindex(bindings: dict[str, int], rev: dict[int, list[str]]) -> None:
+    """Rebuild *rev* from scratch after a bulk change to *bindings*."""
+    rev.clear()
+    for action, key in bindings.items():
+        rev.setdefault(key, []).append(action)
+
+
+def _reindex_all() -> None:
+    for bindings, rev in _LIVE_SETS:
+        _reindex(bindings, rev)
+
+
+def _reverse_of(bindings: dict[str, int]) -> dict[int, list[str]]:
+    """Reverse index for *bindings* (built on the fly for non-live dicts)."""
+    for live, rev in _LIVE_SETS:
+        if live is bindings:
+            return rev
+    rev: dict[int, list[str]] = {}
+    _reindex(bindings, rev)
+    return rev
+
+
+def set_binding(bindings: dict[str, int], action: str, key: int) -> None:
+    """Bind *action* to *key*, keeping the reverse index in sync."""
+    rev = _reverse_of(bindings)
+    old = bindings.get(action)
+    if old is not None:
+        actions = rev.get(old)
+        if actions is not None and action in actions:
+            actions.remove(action)
+            if not actions:
+                del rev[old]
+    bindings[action] = key
+    rev.setdefault(key, []).append(action)
+
+
 def find_conflicts(bindings: dict[str, int]) -> list[tuple[str, str, int]]:
     """Return a list of (action_a, action_b, key) tuples for duplicate keys
     within *one* binding set."""
-    seen: dict[int, str] = {}
     conflicts: list[tuple[str, str, int]] = []
-    for action, key in bindings.items():
-        if key in seen:
-            conflicts.append((seen[key], action, key))
-        else:
-            seen[key] = action
+    for key, actions in _reverse_of(bindings).items():
+        for other in actions[1:]:
+            conflicts.append((actions[0], other, key))
     return conflicts
 
 
 def has_conflict(bindings: dict[str, int], action: str, new_key: int) -> str | None:
     """If *new_key* is already used by another action in *bindings*,
     return that action's name.  Otherwise return None."""
-    for act, key in bindings.items():
-        if act != action and key == new_key:
+    for act in _reverse_of(bindings).get(new_key, ()):
+        if act != action:
             return act
     return None
 
@@ -202,8 +303,9 @@ def has_conflict(bindings: dict[str, int], action: str, new_key: int) -> str | N
 #  Key name helper (for display)
 # ══════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=512)
 def key_name(key_code: int) -> str:
-    """Return a human-readable name for a pygame key constant."""
+    """Return a human-readable name for a pygame key constant (memoised)."""
     return pygame.key.name(key_code).upper()
 
 
@@ -223,6 +325,22 @@ _HINT_CLR    = (140, 140, 140)
 _TAB_ACTIVE  = (100, 180, 255)
 _TAB_INACTIVE = (100, 100, 120)
 
+# High-frequency events the controls menu never handles (blocked while open)
+_MENU_IGNORED_EVENTS = (
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL, pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING,
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.FINGERMOTION,
+)
+
+# Events meaning the window contents must be repainted
+_EXPOSE_EVENTS = frozenset({pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE})
+
+# Controls menu layout (y positions in px)
+_TAB_Y  = 85
+_ROWS_Y = 140
+_ROW_H  = 40
+
 
 class ControlsMenu:
     """Full-screen controls rebinding UI.
@@ -237,23 +355,115 @@ class ControlsMenu:
 
     _TAB_NAMES = ["Solo", "PVP P1", "PVP P2"]
 
-    def __init__(self):
+    __slots__ = (
+        "_wait_for_event", "_tab_index", "_selected_action", "_nav_table",
+        "_waiting_for_key", "_conflict_msg", "_conflict_timer",
+        "_row_font", "_hint_font", "_title_surf", "_tab_surfs",
+        "_action_label_surfs", "_waiting_surf", "_highlight_surf",
+        "_hint_surfs", "_key_surf_cache",
+        "_background", "_drawn_tab", "_drawn_rows", "_drawn_msg",
+    )
+
+    def __init__(self, wait_for_event: bool = True):
+        # True: sleep until input (or the conflict message expires) and
+        # redraw only then.  False: legacy fixed 30 FPS redraw loop.
+        self._wait_for_event = wait_for_event
         self._tab_index = 0
         self._selected_action = 0
+        # Navigation key → handler (ESC is handled by _handle_nav itself)
+        self._nav_table: dict[int, Callable[[], None]] = {
+            pygame.K_TAB:       self._cycle_tab,
+            pygame.K_1:         functools.partial(self._set_tab, 0),
+            pygame.K_2:         functools.partial(self._set_tab, 1),
+            pygame.K_3:         functools.partial(self._set_tab, 2),
+            pygame.K_UP:        functools.partial(self._move_selection, -1),
+            pygame.K_w:         functools.partial(self._move_selection, -1),
+            pygame.K_DOWN:      functools.partial(self._move_selection, 1),
+            pygame.K_s:         functools.partial(self._move_selection, 1),
+            pygame.K_RETURN:    self._begin_rebind,
+            pygame.K_KP_ENTER:  self._begin_rebind,
+            pygame.K_DELETE:    self._reset_action,
+            pygame.K_BACKSPACE: self._reset_action,
+            pygame.K_r:         self._reset_all,
+        }
         self._waiting_for_key = False
         self._conflict_msg: str = ""
         self._conflict_timer: float = 0.0
+        # Fonts and static text are created on the first _draw
+        # (pygame.font may not be initialised yet when the menu is built)
+        self._row_font: pygame.font.Font | None = None
+        self._hint_font: pygame.font.Font | None = None
+        self._title_surf: pygame.Surface | None = None
+        self._tab_surfs: list[tuple[pygame.Surface, pygame.Surface]] = []
+        self._action_label_surfs: list[pygame.Surface] = []
+        self._waiting_surf: pygame.Surface | None = None
+        self._highlight_surf: pygame.Surface | None = None
+        self._hint_surfs: list[pygame.Surface] = []
+        # Rendered key-name text per key code (a rebind just looks up a
+        # different code, so entries never go stale)
+        self._key_surf_cache: dict[int, pygame.Surface] = {}
+        # Static layer (fill, title, action labels, hints) and what was last
+        # drawn over it, so _draw repaints only the regions that changed
+        self._background: pygame.Surface | None = None
+        self._drawn_tab: int | None = None
+        self._drawn_rows: list[tuple | None] | None = None
+        self._drawn_msg: str | None = None
 
     # ── Public entry point ────────────────────────────────
 
     def run(self, screen: pygame.Surface, clock: pygame.time.Clock) -> None:
         """Run the controls-menu loop until the player presses ESC."""
+        init_keybinds()
+        snapshot = (dict(SOLO_KEYS), dict(PVP_P1_KEYS), dict(PVP_P2_KEYS))
+
+        # Keep input the menu ignores out of the queue entirely, so mouse
+        # movement etc. neither wakes the loop nor allocates Event objects
+        newly_blocked = [t for t in _MENU_IGNORED_EVENTS
+                         if not pygame.event.get_blocked(t)]
+        if newly_blocked:
+            pygame.event.set_blocked(newly_blocked)
+        try:
+            self._run_loop(screen, clock)
+        finally:
+            if newly_blocked:
+                pygame.event.set_allowed(newly_blocked)
+
+        # Persist on exit (only if something was actually rebound)
+        if (SOLO_KEYS, PVP_P1_KEYS, PVP_P2_KEYS) != snapshot:
+            save_keybinds()
+
+    def _run_loop(self, screen: pygame.Surface,
+                  clock: pygame.time.Clock) -> None:
         running = True
+        dirty = True
+        self._drawn_rows = None  # screen holds game content: full repaint
+        clock.tick()
         while running:
-            dt = clock.tick(30) / 1000.0
-            self._conflict_timer = max(0.0, self._conflict_timer - dt)
+            if dirty:
+                rects = self._draw(screen)
+                if rects:
+                    pygame.display.update(rects)
+                dirty = not self._wait_for_event
+
+            if self._wait_for_event:
+                # Sleep until an event, or until the conflict message is due
+                # to disappear (a timeout of 0 waits indefinitely)
+                timeout = 0
+                if self._conflict_timer > 0:
+                    timeout = int(self._conflict_timer * 1000) + 1
+                events = [pygame.event.wait(timeout)]
+                events.extend(pygame.event.get())
+                dt = clock.tick() / 1000.0
+            else:
+                dt = clock.tick(30) / 1000.0
+                events = pygame.event.get()
 
-            for event in pygame.event.get():
+            if self._conflict_timer > 0:
+                self._conflict_timer = max(0.0, self._conflict_timer - dt)
+                if self._conflict_timer == 0.0:
+                    dirty = True
+
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     raise SystemExit
@@ -263,54 +473,51 @@ class ControlsMenu:
                         running = self._handle_rebind(event.key)
                     else:
                         running = self._handle_nav(event.key)
-
-            self._draw(screen)
-            pygame.display.flip()
-
-        # Persist on exit
-        save_keybinds()
+                    dirty = True
+                elif event.type in _EXPOSE_EVENTS:
+                    dirty = True
 
     # ── Helpers ───────────────────────────────────────────
 
     @property
     def _bindings(self) -> dict[str, int]:
-        return [SOLO_KEYS, PVP_P1_KEYS, PVP_P2_KEYS][self._tab_index]
+        return _ALL_BINDINGS[self._tab_index]
 
     def _handle_nav(self, key: int) -> bool:
         """Handle navigation keys. Returns False to exit menu."""
         if key == pygame.K_ESCAPE:
             return False  # exit menu
 
-        if key == pygame.K_TAB:
-            self._tab_index = (self._tab_index + 1) % 3
-            self._selected_action = 0
-        elif key == pygame.K_1:
-            self._tab_index = 0
-            self._selected_action = 0
-        elif key == pygame.K_2:
-            self._tab_index = 1
-            self._selected_action = 0
-        elif key == pygame.K_3:
-            self._tab_index = 2
-            self._selected_action = 0
-        elif key in (pygame.K_UP, pygame.K_w):
-            self._selected_action = (self._selected_action - 1) % len(ACTIONS)
-        elif key in (pygame.K_DOWN, pygame.K_s):
-            self._selected_action = (self._selected_action + 1) % len(ACTIONS)
-        elif key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-            self._waiting_for_key = True
-        elif key in (pygame.K_DELETE, pygame.K_BACKSPACE):
-            # Reset this single action to default
-            action = ACTIONS[self._selected_action]
-            defaults = [_DEFAULT_SOLO, _DEFAULT_PVP_P1, _DEFAULT_PVP_P2]
-            self._bindings[action] = defaults[self._tab_index][action]
-        elif key == pygame.K_r:
-            reset_keybinds()
-            self._conflict_msg = "All bindings reset to defaults"
-            self._conflict_timer = 2.0
+        handler = self._nav_table.get(key)
+        if handler is not None:
+            handler()
 
         return True
 
+    def _set_tab(self, index: int) -> None:
+        self._tab_index = index
+        self._selected_action = 0
+
+    def _cycle_tab(self) -> None:
+        self._set_tab((self._tab_index + 1) % len(self._TAB_NAMES))
+
+    def _move_selection(self, step: int) -> None:
+        self._selected_action = (self._selected_action + step) % len(ACTIONS)
+
+    def _begin_rebind(self) -> None:
+        self._waiting_for_key = True
+
+    def _reset_action(self) -> None:
+        """Reset the selected action to its default key."""
+        action = ACTIONS[self._selected_action]
+        set_binding(self._bindings, action,
+                    _ALL_DEFAULTS[self._tab_index][action])
+
+    def _reset_all(self) -> None:
+        reset_keybinds()
+        self._conflict_msg = "All bindings reset to defaults"
+        self._conflict_timer = 2.0
+
     def _handle_rebind(self, key: int) -> bool:
         """Assign a new key to the selected action. Returns True always."""
         # Cancel rebind on ESC
@@ -333,7 +540,7 @@ class ControlsMenu:
             return True
 
         # Assign
-        bindings[action] = key
+        set_binding(bindings, action, key)
         self._waiting_for_key = False
         logger.info(
             "Rebound [%s] %s → %s",
@@ -343,79 +550,146 @@ class ControlsMenu:
 
     # ── Rendering ─────────────────────────────────────────
 
-    def _draw(self, surface: pygame.Surface) -> None:
-        surface.fill(_BG)
-        sw, sh = surface.get_size()
-        cx = sw // 2
-
+    def _init_text(self) -> None:
+        """Create the fonts and pre-render every static text surface."""
         title_font = pygame.font.SysFont(None, 48)
         tab_font = pygame.font.SysFont(None, 30)
-        row_font = pygame.font.SysFont(None, 28)
-        hint_font = pygame.font.SysFont(None, 22)
+        self._row_font = row_font = pygame.font.SysFont(None, 28)
+        self._hint_font = hint_font = pygame.font.SysFont(None, 22)
 
-        # ── Title ─────────────────────────────────────────
-        title = title_font.render("CONTROLS", True, _HEADER_CLR)
-        surface.blit(title, (cx - title.get_width() // 2, 30))
-
-        # ── Tabs ──────────────────────────────────────────
-        tab_y = 85
-        tab_x_start = cx - 180
+        self._title_surf = title_font.render("CONTROLS", True, _HEADER_CLR)
+        # (active, inactive) label per tab
+        self._tab_surfs = []
         for i, name in enumerate(self._TAB_NAMES):
-            color = _TAB_ACTIVE if i == self._tab_index else _TAB_INACTIVE
             label = f"[{i+1}] {name}"
-            txt = tab_font.render(label, True, color)
-            surface.blit(txt, (tab_x_start + i * 130, tab_y))
+            self._tab_surfs.append((
+                tab_font.render(label, True, _TAB_ACTIVE),
+                tab_font.render(label, True, _TAB_INACTIVE),
+            ))
+        self._action_label_surfs = [
+            row_font.render(ACTION_LABELS.get(action, action), True, _ACTION_CLR)
+            for action in ACTIONS
+        ]
+        self._waiting_surf = row_font.render("< press a key >", True, _WAITING_CLR)
+        # Selected-row highlight (rounded rect, transparent corners)
+        self._highlight_surf = pygame.Surface((430, _ROW_H - 4), pygame.SRCALPHA)
+        pygame.draw.rect(self._highlight_surf, _SELECTED_BG,
+                         self._highlight_surf.get_rect(), border_radius=5)
+        self._hint_surfs = [
+            hint_font.render(h, True, _HINT_CLR)
+            for h in (
+                "UP/DOWN: Navigate   ENTER: Rebind   DEL: Reset action   R: Reset all",
+                "TAB or 1-3: Switch tab   ESC: Back",
+            )
+        ]
+
+    def _build_background(self, sw: int, sh: int) -> None:
+        """Pre-composite the parts of the menu that never change."""
+        bg = pygame.Surface((sw, sh)).convert()
+        bg.fill(_BG)
+        cx = sw // 2
+
+        title = self._title_surf
+        bg.blit(title, (cx - title.get_width() // 2, 30))
+
+        col_action_x = cx - 200
+        for i, label_surf in enumerate(self._action_label_surfs):
+            bg.blit(label_surf, (col_action_x, _ROWS_Y + i * _ROW_H + 4))
+
+        for j, txt in enumerate(self._hint_surfs):
+            bg.blit(txt, (cx - txt.get_width() // 2, sh - 60 + j * 24))
+
+        self._background = bg
+
+    def _draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """Bring *surface* up to date and return the rects that changed."""
+        if self._row_font is None:
+            self._init_text()
+        sw, sh = surface.get_size()
+        cx = sw // 2
+
+        bg = self._background
+        full = self._drawn_rows is None
+        if bg is None or bg.get_size() != (sw, sh):
+            self._build_background(sw, sh)
+            bg = self._background
+            full = True
+        # All blits are queued (in paint order) and issued in one blits()
+        seq: list[tuple] = []
+        if full:
+            seq.append((bg, (0, 0)))
+            self._drawn_tab = None
+            self._drawn_rows = [None] * len(ACTIONS)
+            self._drawn_msg = None
+        dirty: list[pygame.Rect] = []
+
+        # ── Tabs ──────────────────────────────────────────
+        if self._tab_index != self._drawn_tab:
+            band = pygame.Rect(0, _TAB_Y, sw, self._tab_surfs[0][0].get_height())
+            seq.append((bg, band, band))
+            tab_x_start = cx - 180
+            for i, (active_surf, inactive_surf) in enumerate(self._tab_surfs):
+                txt = active_surf if i == self._tab_index else inactive_surf
+                seq.append((txt, (tab_x_start + i * 130, _TAB_Y)))
+            self._drawn_tab = self._tab_index
+            dirty.append(band)
 
         # ── Action rows ──────────────────────────────────
-        start_y = 140
-        row_h = 40
         col_action_x = cx - 200
         col_key_x = cx + 60
 
         bindings = self._bindings
+        drawn_rows = self._drawn_rows
         for i, action in enumerate(ACTIONS):
-            y = start_y + i * row_h
-
-            # Highlight selected
-            if i == self._selected_action:
-                pygame.draw.rect(
-                    surface, _SELECTED_BG,
-                    (col_action_x - 10, y - 2, 430, row_h - 4),
-                    border_radius=5,
-                )
-
-            # Action label
-            label = ACTION_LABELS.get(action, action)
-            action_surf = row_font.render(label, True, _ACTION_CLR)
-            surface.blit(action_surf, (col_action_x, y + 4))
+            selected = i == self._selected_action
+            row_state = (selected, selected and self._waiting_for_key,
+                         bindings[action])
+            if row_state == drawn_rows[i]:
+                continue
+            drawn_rows[i] = row_state
+
+            y = _ROWS_Y + i * _ROW_H
+            band = pygame.Rect(0, y - 2, sw, _ROW_H)
+            seq.append((bg, band, band))
+
+            # Highlight selected (drawn under the pre-composited label)
+            if selected:
+                seq.append((self._highlight_surf, (col_action_x - 10, y - 2)))
+                seq.append((self._action_label_surfs[i], (col_action_x, y + 4)))
 
             # Current key
-            if i == self._selected_action and self._waiting_for_key:
-                key_surf = row_font.render(
-                    "< press a key >", True, _WAITING_CLR,
-                )
+            if row_state[1]:
+                key_surf = self._waiting_surf
             else:
-                key_text = key_name(bindings[action])
-                key_surf = row_font.render(key_text, True, _KEY_CLR)
-            surface.blit(key_surf, (col_key_x, y + 4))
+                code = row_state[2]
+                key_surf = self._key_surf_cache.get(code)
+                if key_surf is None:
+                    key_surf = self._row_font.render(key_name(code), True, _KEY_CLR)
+                    self._key_surf_cache[code] = key_surf
+            seq.append((key_surf, (col_key_x, y + 4)))
+            dirty.append(band)
 
         # ── Conflict message ──────────────────────────────
-        if self._conflict_timer > 0 and self._conflict_msg:
-            msg = hint_font.render(self._conflict_msg, True, _CONFLICT_CLR)
-            surface.blit(msg, (cx - msg.get_width() // 2, start_y + len(ACTIONS) * row_h + 10))
-
-        # ── Hints ─────────────────────────────────────────
-        hints = [
-            "UP/DOWN: Navigate   ENTER: Rebind   DEL: Reset action   R: Reset all",
-            "TAB or 1-3: Switch tab   ESC: Back",
-        ]
-        for j, h in enumerate(hints):
-            txt = hint_font.render(h, True, _HINT_CLR)
-            surface.blit(txt, (cx - txt.get_width() // 2, sh - 60 + j * 24))
+        msg_text = self._conflict_msg if self._conflict_timer > 0 else ""
+        if msg_text != self._drawn_msg:
+            msg_y = _ROWS_Y + len(ACTIONS) * _ROW_H + 10
+            band = pygame.Rect(0, msg_y, sw, self._hint_font.get_linesize())
+            seq.append((bg, band, band))
+            if msg_text:
+                msg = self._hint_font.render(msg_text, True, _CONFLICT_CLR)
+                seq.append((msg, (cx - msg.get_width() // 2, msg_y)))
+            self._drawn_msg = msg_text
+            dirty.append(band)
+
+        if seq:
+            surface.blits(seq, doreturn=False)
+        if full:
+            return [surface.get_rect()]
+        return dirty
 
 
 # ══════════════════════════════════════════════════════════
-#  Auto-load on import
+#  Initial (default) reverse indices – saved bindings load in init_keybinds
 # ══════════════════════════════════════════════════════════
 
-load_keybinds()
+_reindex_all()
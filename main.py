@@ -19,6 +19,7 @@ VERSION = "1.2.0"
 
 import pygame
 import sys
+import functools
 import logging
 import math
 
@@ -44,12 +45,17 @@ from systems.buff_system import BuffManager, roll_buff_drop, draw_buff_indicator
 from systems.vfx_system import VFXSystem
 from systems.pvp_system import PVPManager
 from systems.projectile_system import ProjectileSystem, Projectile
-from systems.healthbar import draw_health_bars, _clear_cache as clear_healthbar_cache
+from systems.healthbar import (
+    draw_health_bars, health_bars_settled,
+    _clear_cache as clear_healthbar_cache,
+)
 from systems.character_select import CharacterSelectScreen, PLAYER_ROLES, role_to_build_type
 from systems.ai_debug_overlay import AIDebugOverlay
+from systems import regen_jit, _particle_math
 from utils import draw_text, draw_end_screen
 from utils.vfx import (
-    draw_gradient, ScreenShake, FloatingTextManager, EffectsManager,
+    draw_gradient, scroll_over_gradient,
+    ScreenShake, FloatingTextManager, EffectsManager,
     TimeScaleManager, HitStop, CameraZoom, ImpactFlash,
     ComboCounter, draw_vignette, FinalHitCinematic, ArchetypeBanner,
 )
@@ -62,7 +68,37 @@ from avatar_generator import (
     pick_image_file, cleanup_original, _HAS_DEPS as _AVATAR_DEPS_OK,
 )
 from audio_manager import AudioManager
-from keybinds import SOLO_KEYS, ControlsMenu
+from keybinds import SOLO_KEYS, ControlsMenu, init_keybinds
+
+# Squared melee range for the enemy hit fallback (avoids a sqrt per check)
+_ATTACK_RANGE_SQ = ATTACK_RANGE * ATTACK_RANGE
+
+# Floating-label color for each AI combat phase
+_PHASE_COLORS = {
+    "OBSERVE": (120, 200, 255),
+    "COUNTER": (255, 200, 80),
+    "DESPERATION": (255, 80, 50),
+    "RAGE": (255, 40, 20),
+}
+
+# Window events after which a static menu screen must be repainted
+_EXPOSE_EVENTS = frozenset({pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE})
+
+
+# ══════════════════════════════════════════════════════════
+#  FONT CACHE
+# ══════════════════════════════════════════════════════════
+
+@functools.lru_cache(maxsize=32)
+def _font(size: int) -> pygame.font.Font:
+    """Default-face font at *size*, created once and reused every frame."""
+    return pygame.font.SysFont(None, size)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_text(text: str, size: int, color: tuple) -> pygame.Surface:
+    """Rendered (antialiased) *text*, memoised – for static screen labels."""
+    return _font(size).render(text, True, color)
 
 
 # ══════════════════════════════════════════════════════════
@@ -73,14 +109,11 @@ def _draw_mode_select(screen: pygame.Surface):
     """Draw the Solo / PVP mode selection screen."""
     draw_gradient(screen)
     cx = SCREEN_WIDTH // 2
-    title_font = pygame.font.SysFont(None, 54)
-    opt_font = pygame.font.SysFont(None, 36)
-    hint_font = pygame.font.SysFont(None, 24)
 
-    title = title_font.render("AI Learning Opponent", True, WHITE)
+    title = _render_text("AI Learning Opponent", 54, WHITE)
     screen.blit(title, (cx - title.get_width() // 2, 80))
 
-    sub = hint_font.render("Adaptive Combat Game", True, (160, 160, 160))
+    sub = _render_text("Adaptive Combat Game", 24, (160, 160, 160))
     screen.blit(sub, (cx - sub.get_width() // 2, 130))
 
     options = [
@@ -90,12 +123,12 @@ def _draw_mode_select(screen: pygame.Surface):
     ]
     y = 220
     for text, color in options:
-        surf = opt_font.render(text, True, color)
+        surf = _render_text(text, 36, color)
         screen.blit(surf, (cx - surf.get_width() // 2, y))
         y += 55
 
-    hint = hint_font.render(
-        "Press 1, 2, or 3 to select  |  ESC to quit", True, (140, 140, 140),
+    hint = _render_text(
+        "Press 1, 2, or 3 to select  |  ESC to quit", 24, (140, 140, 140),
     )
     screen.blit(hint, (cx - hint.get_width() // 2, SCREEN_HEIGHT - 50))
     pygame.display.flip()
@@ -105,40 +138,40 @@ def _draw_mode_select(screen: pygame.Surface):
 #  STAMINA BAR DRAWING
 # ══════════════════════════════════════════════════════════
 
-def draw_stamina_bars(surface: pygame.Surface, player, enemy, dt: float = 0.016):
-    """Draw stamina bars beneath health bars for both characters."""
-    for i, (entity, hb_x) in enumerate([(player, PLAYER_HB_X),
-                                         (enemy, ENEMY_HB_X)]):
-        x = hb_x
-        y = STAMINABAR_Y
-        w = HEALTHBAR_WIDTH
-        h = STAMINABAR_HEIGHT
-
-        # Background
-        pygame.draw.rect(surface, (40, 40, 40), (x, y, w, h), border_radius=2)
-
-        # Fill
-        if hasattr(entity, 'stamina_component'):
-            frac = entity.stamina_component.stamina / max(1, entity.stamina_component.max_stamina)
-        elif hasattr(entity, 'stamina'):
-            frac = entity.stamina / max(1, entity.max_stamina)
-        else:
-            frac = 1.0
-        fill_w = int(w * max(0.0, min(1.0, frac)))
-
-        # Color: blue → orange when low
-        if frac > 0.5:
-            color = (60, 160, 255)
-        elif frac > 0.25:
-            color = (255, 180, 60)
-        else:
-            color = (255, 80, 60)
+# Stamina bar colors and outline rects (player, enemy)
+_STAM_BG = (40, 40, 40)
+_STAM_BORDER = (80, 80, 80)
+_STAM_HI = (60, 160, 255)
+_STAM_MID = (255, 180, 60)
+_STAM_LO = (255, 80, 60)
+_STAM_RECTS = (
+    (PLAYER_HB_X, STAMINABAR_Y, HEALTHBAR_WIDTH, STAMINABAR_HEIGHT),
+    (ENEMY_HB_X, STAMINABAR_Y, HEALTHBAR_WIDTH, STAMINABAR_HEIGHT),
+)
+
+
+def _draw_stamina_bar(surface: pygame.Surface, frac: float, bar: tuple):
+    """Draw one stamina bar (background, fill, border) in outline *bar*."""
+    draw_rect = pygame.draw.rect
+    x, y, w, h = bar
+
+    # Background
+    draw_rect(surface, _STAM_BG, bar, border_radius=2)
 
-        if fill_w > 0:
-            pygame.draw.rect(surface, color, (x, y, fill_w, h), border_radius=2)
+    # Fill – color: blue → orange when low
+    fill_w = int(w * max(0.0, min(1.0, frac)))
+    if fill_w > 0:
+        color = _STAM_HI if frac > 0.5 else (_STAM_MID if frac > 0.25 else _STAM_LO)
+        draw_rect(surface, color, (x, y, fill_w, h), border_radius=2)
 
-        # Border
-        pygame.draw.rect(surface, (80, 80, 80), (x, y, w, h), 1, border_radius=2)
+    # Border
+    draw_rect(surface, _STAM_BORDER, bar, 1, border_radius=2)
+
+
+def draw_stamina_bars(surface: pygame.Surface, player, enemy, dt: float = 0.016):
+    """Draw stamina bars beneath health bars for both characters."""
+    _draw_stamina_bar(surface, player.stamina_fraction, _STAM_RECTS[0])
+    _draw_stamina_bar(surface, enemy.stamina_fraction, _STAM_RECTS[1])
 
 
 # ══════════════════════════════════════════════════════════
@@ -153,14 +186,30 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(TITLE)
         self.clock = pygame.time.Clock()
+        # Off-screen solo scene, repainted from the gradient each frame
+        # (until it settles after a match, see _draw)
+        self._world = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._world_frozen = False
+
+        # Saved key bindings (before any Player caches its keys)
+        init_keybinds()
+        self._refresh_solo_keys()
+        self._keys = pygame.key.get_pressed()   # refreshed by _handle_events
 
         # Ensure persistent archetype stats file exists
         load_archetype_stats()
 
+        # Compile JIT kernels now rather than on first use mid-match
+        regen_jit.warmup()
+        _particle_math.warmup()
+
         # Avatar state (persists across resets)
         self._avatar_surface: pygame.Surface | None = load_cached_avatar(
             output_size=64
         )
+        # 96×96 menu preview of _avatar_surface, rebuilt when it changes
+        self._avatar_preview: pygame.Surface | None = None
+        self._avatar_preview_src: pygame.Surface | None = None
 
         # Mode state
         self._show_mode_select = True
@@ -172,6 +221,7 @@ class Game:
 
         # PVP manager (created on PVP start)
         self.pvp_manager: PVPManager | None = None
+        self._pvp_events: list[pygame.event.Event] = []   # this frame's batch
 
         # Solo-mode entities (created after mode/avatar selection)
         self.player: Player | None = None
@@ -212,6 +262,7 @@ class Game:
 
         # State
         self.game_state = "MENU"   # "MENU" | "CHARACTER_SELECT" | "PLAYING" | "GAME_OVER"
+        self._retarget()           # per-frame function for game_state
         self.running = True
         self.game_over = False
         self.winner_text = ""
@@ -225,6 +276,12 @@ class Game:
         # Buff drop pending
         self._buff_dropped = False
 
+        # Enemy brain sub-systems, probed once per match (see _init_solo)
+        self._enemy_desperation = None
+        self._enemy_phase = None
+        self._ai_has_phase_event = False
+        self._ai_has_rage_event = False
+
         # AI debug overlay (F1 to toggle)
         self.debug_overlay = AIDebugOverlay(self.screen)
 
@@ -251,6 +308,14 @@ class Game:
 
         self.enemy = Enemy(player_style=self.player_style, build_type=build_type)
 
+        # The brain's optional parts are fixed for its lifetime, so look
+        # them up here rather than with hasattr() every frame
+        ai = self.enemy.ai_controller
+        self._enemy_desperation = getattr(ai, "desperation", None)
+        self._enemy_phase = getattr(ai, "phase", None)
+        self._ai_has_phase_event = hasattr(ai, "event_phase_transition")
+        self._ai_has_rage_event = hasattr(ai, "event_rage_entered")
+
         self.logger.start_match()
         self.match_stats = MatchStats(self.player_style, self.enemy.archetype)
 
@@ -261,6 +326,8 @@ class Game:
         self.game_over = False
         self.winner_text = ""
         self._buff_dropped = False
+        self._world_frozen = False
+        self._now_s = pygame.time.get_ticks() / 1000.0
 
     # ── Main loop ─────────────────────────────────────────
 
@@ -268,42 +335,87 @@ class Game:
         """Start the game loop."""
         while self.running:
             self.clock.tick(FPS)
-
-            if self.game_state == "MENU":
-                self._handle_home_events()
-                self._draw_home_screen()
-
-            elif self.game_state == "CHARACTER_SELECT":
-                self._handle_char_select_events()
-                if self._char_select:
-                    raw_dt = self.clock.get_time() / 1000.0
-                    self._char_select.update(raw_dt)
-                    self._char_select.draw()
-
-            elif self.game_state == "PLAYING":
-                if self._show_mode_select:
-                    self._handle_mode_select_events()
-                    _draw_mode_select(self.screen)
-                elif self._show_menu:
-                    self._handle_menu_events()
-                    self._draw_menu()
-                elif self._mode == "pvp" and self.pvp_manager:
-                    self._handle_pvp_events()
-                    self._update_pvp()
-                    self._draw_pvp()
-                else:
-                    # Solo mode
-                    self._handle_events()
-                    self._update()
-                    self._draw()
-
-            elif self.game_state == "GAME_OVER":
-                self._handle_game_over_events()
-                self._draw_game_over_screen()
+            self._tick()
 
         pygame.quit()
         sys.exit()
 
+    def _retarget(self):
+        """Point ``self._tick`` at the frame function for the current state.
+
+        Call after any change to ``game_state``, ``_show_mode_select``,
+        ``_show_menu``, ``_mode`` or ``pvp_manager``.
+        """
+        state = self.game_state
+        if state == "MENU":
+            tick = self._tick_home
+        elif state == "CHARACTER_SELECT":
+            tick = self._tick_char_select
+        elif state == "PLAYING":
+            if self._show_mode_select:
+                tick = self._tick_mode_select
+            elif self._show_menu:
+                tick = self._tick_avatar_menu
+            elif self._mode == "pvp" and self.pvp_manager:
+                tick = self._tick_pvp
+            else:
+                tick = self._tick_solo
+        elif state == "GAME_OVER":
+            tick = self._tick_game_over
+        else:
+            tick = self._tick_idle
+        self._tick = tick
+        # The new screen needs at least one draw
+        self._menu_dirty = True
+
+    # Static screens (home, mode select, avatar menu) only repaint when
+    # _menu_dirty is set; otherwise the last presented frame stays up.
+
+    def _tick_home(self):
+        dirty, self._menu_dirty = self._menu_dirty, False
+        self._handle_home_events()
+        if dirty:
+            self._draw_home_screen()
+
+    def _tick_char_select(self):
+        self._handle_char_select_events()
+        if self._char_select:
+            raw_dt = self.clock.get_time() / 1000.0
+            self._char_select.update(raw_dt)
+            self._char_select.draw()
+
+    def _tick_mode_select(self):
+        dirty, self._menu_dirty = self._menu_dirty, False
+        self._handle_mode_select_events()
+        if dirty:
+            _draw_mode_select(self.screen)
+
+    def _tick_avatar_menu(self):
+        dirty, self._menu_dirty = self._menu_dirty, False
+        self._handle_menu_events()
+        if dirty:
+            self._draw_menu()
+
+    def _tick_pvp(self):
+        self._handle_pvp_events()
+        self._update_pvp()
+        self._draw_pvp()
+
+    def _tick_solo(self):
+        # Frame timestamp for AI notifications (the brain's get_ticks
+        # clock), taken before input so attacks and enemy hits share it
+        self._now_s = pygame.time.get_ticks() / 1000.0
+        self._handle_events()
+        self._update()
+        self._draw()
+
+    def _tick_game_over(self):
+        self._handle_game_over_events()
+        self._draw_game_over_screen()
+
+    def _tick_idle(self):
+        pass
+
     # ── Home Screen (MENU state) ──────────────────────────
 
     def _handle_home_events(self):
@@ -311,10 +423,13 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type in _EXPOSE_EVENTS:
+                self._menu_dirty = True
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN:
                     self.game_state = "PLAYING"
                     self._show_mode_select = True
+                    self._retarget()
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
 
@@ -324,26 +439,22 @@ class Game:
         cx = SCREEN_WIDTH // 2
         cy = SCREEN_HEIGHT // 2
 
-        title_font = pygame.font.SysFont(None, 72)
-        subtitle_font = pygame.font.SysFont(None, 36)
-        footer_font = pygame.font.SysFont(None, 28)
-
         # Title
-        title_surf = title_font.render("ADAPTIVE COMBAT AI", True, WHITE)
+        title_surf = _render_text("ADAPTIVE COMBAT AI", 72, WHITE)
         self.screen.blit(
             title_surf,
             (cx - title_surf.get_width() // 2, cy - 80),
         )
 
         # Subtitle
-        sub_surf = subtitle_font.render("Press ENTER to Start", True, (180, 200, 255))
+        sub_surf = _render_text("Press ENTER to Start", 36, (180, 200, 255))
         self.screen.blit(
             sub_surf,
             (cx - sub_surf.get_width() // 2, cy + 10),
         )
 
         # Footer
-        foot_surf = footer_font.render("Press ESC to Quit", True, (140, 140, 140))
+        foot_surf = _render_text("Press ESC to Quit", 28, (140, 140, 140))
         self.screen.blit(
             foot_surf,
             (cx - foot_surf.get_width() // 2, SCREEN_HEIGHT - 60),
@@ -357,6 +468,8 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type in _EXPOSE_EVENTS:
+                self._menu_dirty = True
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_1:
                     self._mode = "solo"
@@ -367,14 +480,17 @@ class Game:
                     )
                     self._show_char_select = True
                     self.game_state = "CHARACTER_SELECT"
+                    self._retarget()
                 elif event.key == pygame.K_2:
                     self._mode = "pvp"
                     self._show_mode_select = False
                     self._start_pvp()
+                    self._retarget()
                 elif event.key == pygame.K_3:
                     self._open_controls_menu()
                 elif event.key == pygame.K_ESCAPE:
                     self.game_state = "MENU"
+                    self._retarget()
 
     # ── Character select (solo only) ──────────────────────
 
@@ -394,12 +510,14 @@ class Game:
                 # Proceed to avatar menu
                 self._show_menu = True
                 self.game_state = "PLAYING"
+                self._retarget()
             elif result == "back":
                 self._show_char_select = False
                 self._char_select = None
                 # Return to mode select
                 self._show_mode_select = True
                 self.game_state = "PLAYING"
+                self._retarget()
 
     def _start_pvp(self):
         """Initialize PVP mode."""
@@ -411,29 +529,44 @@ class Game:
         """Open the full-screen controls rebinding UI."""
         menu = ControlsMenu()
         menu.run(self.screen, self.clock)
+        self._menu_dirty = True        # the controls menu drew over us
+        self._refresh_solo_keys()
+        if self.player is not None:
+            self.player.rebind()
+
+    def _refresh_solo_keys(self):
+        """Cache the solo key codes (call after SOLO_KEYS changes)."""
+        self._move_keys = (
+            SOLO_KEYS["move_left"], SOLO_KEYS["move_right"],
+            SOLO_KEYS["move_up"], SOLO_KEYS["move_down"],
+        )
+        self._k_attack = SOLO_KEYS["quick_attack"]
+        self._k_dodge = SOLO_KEYS["dodge"]
+        self._k_block = SOLO_KEYS["block"]
 
     # ── PVP event / update / draw ─────────────────────────
 
     def _handle_pvp_events(self):
-        self._pvp_events = []
-        for event in pygame.event.get():
+        # Hand the whole batch to the PVP manager; scan it here for menu keys
+        events = self._pvp_events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self._show_mode_select = True
                     self.pvp_manager = None
+                    self._retarget()
                     return
                 if event.key == pygame.K_r and self.pvp_manager and self.pvp_manager.round_over:
                     self.pvp_manager.start_round()
-            self._pvp_events.append(event)
 
     def _update_pvp(self):
         if self.pvp_manager is None:
             return
         raw_dt = self.clock.get_time() / 1000.0
         keys = pygame.key.get_pressed()
-        events = getattr(self, '_pvp_events', [])
+        events = self._pvp_events
         self.pvp_manager.handle_input(keys, events, self.combat)
         self.pvp_manager.update(raw_dt, self.combat)
 
@@ -449,16 +582,14 @@ class Game:
         if self.pvp_manager is None:
             return
         raw_dt = self.clock.get_time() / 1000.0
-        world = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        draw_gradient(world)
-        self.pvp_manager.draw(world, raw_dt)
-        draw_vignette(world)
-        self.screen.blit(world, (0, 0))
+        # No camera effects in PVP, so compose straight onto the screen
+        draw_gradient(self.screen)
+        self.pvp_manager.draw(self.screen, raw_dt)
+        draw_vignette(self.screen)
 
         # Controls hint
-        hint_font = pygame.font.SysFont(None, 18)
-        p1h = hint_font.render("P1: WASD + F/G/H", True, (120, 120, 180))
-        p2h = hint_font.render("P2: Arrows + Num1/2/3", True, (180, 120, 120))
+        p1h = _render_text("P1: WASD + F/G/H", 18, (120, 120, 180))
+        p2h = _render_text("P2: Arrows + Num1/2/3", 18, (180, 120, 120))
         self.screen.blit(p1h, (10, SCREEN_HEIGHT - 20))
         self.screen.blit(p2h, (SCREEN_WIDTH - p2h.get_width() - 10, SCREEN_HEIGHT - 20))
 
@@ -477,38 +608,41 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type in _EXPOSE_EVENTS:
+                self._menu_dirty = True
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_1:
                     self._avatar_surface = None
                     self._show_menu = False
                     self._init_solo()
+                    self._retarget()
                 elif event.key == pygame.K_2:
                     if _AVATAR_DEPS_OK:
                         self._try_generate_avatar()
                         self._show_menu = False
                         self._init_solo()
+                        self._retarget()
                     else:
                         logger.warning("opencv-python/numpy/scipy not installed – skipping avatar.")
                         self._avatar_surface = None
                         self._show_menu = False
                         self._init_solo()
+                        self._retarget()
                 elif event.key == pygame.K_3 and self._avatar_surface is not None:
                     self._show_menu = False
                     self._init_solo()
+                    self._retarget()
                 elif event.key == pygame.K_ESCAPE:
                     self._show_mode_select = True
                     self._show_menu = False
+                    self._retarget()
 
     def _draw_menu(self):
         """Render the avatar selection menu."""
         draw_gradient(self.screen)
         cx = SCREEN_WIDTH // 2
 
-        title_font = pygame.font.SysFont(None, 48)
-        opt_font = pygame.font.SysFont(None, 32)
-        hint_font = pygame.font.SysFont(None, 24)
-
-        title = title_font.render("Character Setup", True, WHITE)
+        title = _render_text("Character Setup", 48, WHITE)
         self.screen.blit(title, (cx - title.get_width() // 2, 100))
 
         opts = [
@@ -523,21 +657,25 @@ class Game:
 
         y = 200
         for text, color in opts:
-            surf = opt_font.render(text, True, color)
+            surf = _render_text(text, 32, color)
             self.screen.blit(surf, (cx - surf.get_width() // 2, y))
             y += 50
 
-        if self._avatar_surface is not None:
-            preview = pygame.transform.smoothscale(
-                self._avatar_surface, (96, 96),
-            )
+        avatar = self._avatar_surface
+        if avatar is not None:
+            if self._avatar_preview_src is not avatar:
+                self._avatar_preview = pygame.transform.smoothscale(
+                    avatar, (96, 96),
+                )
+                self._avatar_preview_src = avatar
+            preview = self._avatar_preview
             self.screen.blit(preview, (cx - 48, y + 20))
-            lbl = hint_font.render("(cached)", True, (160, 160, 160))
+            lbl = _render_text("(cached)", 24, (160, 160, 160))
             self.screen.blit(lbl, (cx - lbl.get_width() // 2, y + 120))
 
-        hint = hint_font.render(
+        hint = _render_text(
             "Press a number key to choose  |  ESC to go back",
-            True, (140, 140, 140),
+            24, (140, 140, 140),
         )
         self.screen.blit(hint, (cx - hint.get_width() // 2, SCREEN_HEIGHT - 50))
         pygame.display.flip()
@@ -579,18 +717,20 @@ class Game:
     def _handle_events(self):
         if self.player is None:
             return
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        # Held keys, sampled once per frame after the pump (_update reuses it)
+        keys = self._keys = pygame.key.get_pressed()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
 
             if event.type == pygame.KEYDOWN:
                 # Quick attack
-                if event.key == SOLO_KEYS["quick_attack"] and not self.game_over:
+                if event.key == self._k_attack and not self.game_over:
                     self._player_attack()
 
                 # Dodge
-                if event.key == SOLO_KEYS["dodge"] and not self.game_over:
-                    keys = pygame.key.get_pressed()
+                if event.key == self._k_dodge and not self.game_over:
                     if self.player is not None and self.player.try_dodge(keys):
                         self.audio.play_sfx("combo_whoosh",
                                             x_pos=float(self.player.rect.centerx))
@@ -609,6 +749,7 @@ class Game:
                     self.player = None
                     self.enemy = None
                     self.game_over = False
+                    self._retarget()
 
     def _player_ability(self):
         """Attempt to activate the player's role ability (Q key)."""
@@ -633,8 +774,7 @@ class Game:
                 self.match_stats.record_player_damage(result.damage)
             # Notify AI brain of damage taken (for match flow / desperation)
             if self.enemy and hasattr(self.enemy, 'ai_controller'):
-                now_sec = pygame.time.get_ticks() / 1000.0
-                self.enemy.ai_controller.notify_damage_taken(now_sec, result.damage)
+                self.enemy.ai_controller.notify_damage_taken(self._now_s, result.damage)
             self.combo.register_hit()
             combo_count = self.combo.count
 
@@ -749,14 +889,17 @@ class Game:
             return
 
         # ── Player input (skipped in simulation mode) ─────
+        moving = False
         if not self.simulation_mode:
-            keys = pygame.key.get_pressed()
+            keys = self._keys
+            k_left, k_right, k_up, k_down = self._move_keys
+            moving = keys[k_left] or keys[k_right] or keys[k_up] or keys[k_down]
             self.player.handle_input(keys)
 
             # Block (held key)
-            block_pressed = keys[SOLO_KEYS["block"]]
+            block_pressed = keys[self._k_block]
             was_blocking = self.player.is_blocking
-            self.player.try_block(block_pressed)
+            self.player.try_block(block_pressed, dt)
 
             # Register block start/end for parry detection
             if self.player.is_blocking and not was_blocking:
@@ -765,8 +908,7 @@ class Game:
                 self.combat.register_block_end(self.player)
 
             # Log movement
-            if any(keys[k] for k in (SOLO_KEYS["move_left"], SOLO_KEYS["move_right"],
-                                      SOLO_KEYS["move_up"], SOLO_KEYS["move_down"])):
+            if moving:
                 self.logger.log_movement()
 
         # Player animation update
@@ -788,8 +930,8 @@ class Game:
                         speed=PROJECTILE_SPEED,
                         owner_id=id(self.player),
                     )
-                    self.audio.play_sfx("combo_whoosh",
-                                        x_pos=px)
+                    self.audio.queue_sfx("combo_whoosh",
+                                         x_pos=px)
 
         # ── Stamina system update ────────────────────────
         self.stamina_system.update(self.player, dt)
@@ -806,17 +948,17 @@ class Game:
         if self.simulation_mode:
             player_is_active = self.player.is_attacking
         else:
-            player_is_active = (
-                any(pygame.key.get_pressed()[k]
-                    for k in (SOLO_KEYS["move_left"], SOLO_KEYS["move_right"],
-                              SOLO_KEYS["move_up"], SOLO_KEYS["move_down"]))
-                or self.player.is_attacking
-            )
+            player_is_active = moving or self.player.is_attacking
         self.enemy.clock_dt = dt
         self.enemy.update(self.player, player_is_active=player_is_active, dt=dt)
 
+        # Nothing below moves either character this frame, so read the
+        # centers once
+        ecx, ecy = self.enemy.rect.center
+        pcx, pcy = self.player.rect.center
+
         # Face toward each other
-        self.player.face_toward(self.enemy.rect.centerx)
+        self.player.face_toward(ecx)
 
         # ── Enemy MELEE attack resolution ────────────────
         # The AIController buffers damage in _pending_damage.
@@ -835,13 +977,13 @@ class Game:
                     logger.debug("Hitbox collision confirmed (enemy → player)")
             else:
                 # Fallback: range check
-                dist_check = math.hypot(
-                    self.enemy.rect.centerx - self.player.rect.centerx,
-                    self.enemy.rect.centery - self.player.rect.centery,
-                )
-                hit_confirmed = dist_check <= ATTACK_RANGE
-                if hit_confirmed:
-                    logger.debug("Range collision confirmed (enemy → player, dist=%.0f)", dist_check)
+                dx = ecx - pcx
+                dy = ecy - pcy
+                dist_sq = dx * dx + dy * dy
+                hit_confirmed = dist_sq <= _ATTACK_RANGE_SQ
+                if hit_confirmed and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Range collision confirmed (enemy → player, dist=%.0f)",
+                                 math.sqrt(dist_sq))
 
             if hit_confirmed:
                 atk_type = self.enemy.last_attack_type or "quick"
@@ -855,12 +997,11 @@ class Game:
                 # Notify AI brain: hit landed → queues combo + match flow
                 if result.hit and result.damage > 0:
                     self.enemy.ai_controller.notify_hit_landed()
-                    now_sec = pygame.time.get_ticks() / 1000.0
-                    self.enemy.ai_controller.notify_damage_dealt(now_sec, result.damage)
+                    self.enemy.ai_controller.notify_damage_dealt(self._now_s, result.damage)
 
                 # Weapon trail VFX on every attack (all personalities)
-                ex = float(self.enemy.rect.centerx)
-                ey = float(self.enemy.rect.centery)
+                ex = float(ecx)
+                ey = float(ecy)
                 trail_dx = 35.0 * self.enemy.facing
                 is_duelist = self.enemy.personality.name == "Duelist"
                 trail_color = (180, 220, 255) if is_duelist else (220, 200, 180)
@@ -874,7 +1015,7 @@ class Game:
                     color = (80, 220, 255) if atk_type == "counter" else (255, 200, 60)
                     self.floating_texts.spawn(
                         label,
-                        self.enemy.rect.centerx - 30,
+                        ecx - 30,
                         self.enemy.rect.top - 30,
                         color=color, size=28,
                     )
@@ -890,16 +1031,16 @@ class Game:
         # ── Enemy PROJECTILE spawning ────────────────────
         if self.enemy.ai_controller.get_pending_projectile():
             self.projectiles.spawn_at(
-                x=float(self.enemy.rect.centerx),
-                y=float(self.enemy.rect.centery),
-                target_x=float(self.player.rect.centerx),
-                target_y=float(self.player.rect.centery),
+                x=float(ecx),
+                y=float(ecy),
+                target_x=float(pcx),
+                target_y=float(pcy),
                 damage=PROJECTILE_DAMAGE,
                 speed=PROJECTILE_SPEED,
                 owner_id=id(self.enemy),
             )
-            self.audio.play_sfx("combo_whoosh",
-                                x_pos=float(self.enemy.rect.centerx))
+            self.audio.queue_sfx("combo_whoosh",
+                                 x_pos=float(ecx))
 
         # ── Projectile update & collision ────────────────
         self.projectiles.update(dt)
@@ -909,12 +1050,10 @@ class Game:
         for proj in player_proj_hits:
             result = self.combat.player_projectile_hit(self.player, self.enemy, proj.damage)
             if result.hit and result.damage > 0:
-                ex = self.enemy.rect.centerx
-                ey = self.enemy.rect.centery
-                self.vfx.spawn_magic_impact(float(ex), float(ey))
-                self.vfx.spawn_hit_flash(float(ex), float(ey))
+                self.vfx.spawn_magic_impact(float(ecx), float(ecy))
+                self.vfx.spawn_hit_flash(float(ecx), float(ecy))
                 self.floating_texts.spawn(
-                    f"-{result.damage}", ex - 12,
+                    f"-{result.damage}", ecx - 12,
                     self.enemy.rect.top - 10,
                     color=(100, 180, 255), size=26,
                 )
@@ -922,7 +1061,7 @@ class Game:
                 self.impact_flash.trigger(
                     color=(100, 180, 255), alpha=80, duration=0.1,
                 )
-                self.audio.play_sfx("light_hit", x_pos=float(ex))
+                self.audio.queue_sfx("light_hit", x_pos=float(ecx))
                 if self.match_stats:
                     self.match_stats.record_player_damage(result.damage)
                 logger.debug("Player projectile hit enemy for %d damage", result.damage)
@@ -937,14 +1076,12 @@ class Game:
                 attack_type="magic",
             )
             if result.hit and result.damage > 0:
-                px = self.player.rect.centerx
-                py = self.player.rect.centery
                 # Magic impact VFX
-                self.vfx.spawn_magic_impact(float(px), float(py))
-                self.vfx.spawn_hit_flash(float(px), float(py))
+                self.vfx.spawn_magic_impact(float(pcx), float(pcy))
+                self.vfx.spawn_hit_flash(float(pcx), float(pcy))
                 # Floating damage number
                 self.floating_texts.spawn(
-                    f"-{result.damage}", px - 12,
+                    f"-{result.damage}", pcx - 12,
                     self.player.rect.top - 10,
                     color=(180, 120, 255), size=26,
                 )
@@ -953,8 +1090,8 @@ class Game:
                 self.impact_flash.trigger(
                     color=(180, 120, 255), alpha=80, duration=0.1,
                 )
-                self.audio.play_sfx("light_hit", x_pos=float(px))
-                self.audio.play_sfx("health_tick")
+                self.audio.queue_sfx("light_hit", x_pos=float(pcx))
+                self.audio.queue_sfx("health_tick")
                 logger.debug("Projectile hit player for %d damage", result.damage)
 
         # ── Match stats tracking ─────────────────────────
@@ -966,53 +1103,53 @@ class Game:
 
         # Log player-enemy distance
         dist = math.hypot(
-            self.player.rect.centerx - self.enemy.rect.centerx,
-            self.player.rect.centery - self.enemy.rect.centery,
+            pcx - ecx,
+            pcy - ecy,
         )
         self.logger.log_distance(dist)
 
         # ── Regen VFX ────────────────────────────────────
-        if self.enemy._is_regenerating:
+        if self.enemy.is_regenerating:
             self._regen_ring_cd -= dt
             if self._regen_ring_cd <= 0:
                 self.effects.spawn_ring(
-                    self.enemy.rect.centerx, self.enemy.rect.centery,
+                    ecx, ecy,
                     (80, 255, 80), max_radius=50, duration=0.7, width=2,
                 )
                 self.vfx.spawn_heal_sparkle(
-                    float(self.enemy.rect.centerx),
-                    float(self.enemy.rect.centery),
+                    float(ecx),
+                    float(ecy),
                 )
-                self.audio.play_sfx("regen_tick",
-                                    x_pos=float(self.enemy.rect.centerx))
+                self.audio.queue_sfx("regen_tick",
+                                     x_pos=float(ecx))
                 self._regen_ring_cd = 1.0
 
         # ── Desperation aura VFX ─────────────────────────
-        if hasattr(self.enemy.ai_controller, 'desperation'):
-            desp = self.enemy.ai_controller.desperation
-            if desp.active:
-                # Red aura particles around enemy, intensity scales with desperation
-                count = max(1, int(3 * desp.modifiers.intensity))
+        desp = self._enemy_desperation
+        if desp is not None and desp.active:
+            # Red aura particles around enemy, intensity scales with desperation
+            count = max(1, int(3 * desp.modifiers.intensity))
+            self.vfx.spawn_aura_particles(
+                float(ecx),
+                float(ecy),
+                color=(255, 60, 40), count=count, radius=28,
+            )
+            # Rage mode: extra golden/orange particles + glow
+            if desp.modifiers.rage_active:
                 self.vfx.spawn_aura_particles(
-                    float(self.enemy.rect.centerx),
-                    float(self.enemy.rect.centery),
-                    color=(255, 60, 40), count=count, radius=28,
+                    float(ecx),
+                    float(ecy),
+                    color=(255, 180, 30), count=count + 2, radius=35,
                 )
-                # Rage mode: extra golden/orange particles + glow
-                if desp.modifiers.rage_active:
-                    self.vfx.spawn_aura_particles(
-                        float(self.enemy.rect.centerx),
-                        float(self.enemy.rect.centery),
-                        color=(255, 180, 30), count=count + 2, radius=35,
-                    )
 
         # ── Phase transition cinematic triggers ───────────
         ai = self.enemy.ai_controller
-        if hasattr(ai, 'event_phase_transition') and ai.event_phase_transition:
+        if self._ai_has_phase_event and ai.event_phase_transition:
             # Phase shift burst: aggression spike VFX + screen shake
-            ex = float(self.enemy.rect.centerx)
-            ey = float(self.enemy.rect.centery)
-            phase_name = ai.phase.phase_name if hasattr(ai, 'phase') else "?"
+            ex = float(ecx)
+            ey = float(ecy)
+            phase = self._enemy_phase
+            phase_name = phase.phase_name if phase is not None else "?"
             # Burst ring
             self.effects.spawn_ring(
                 int(ex), int(ey),
@@ -1021,13 +1158,7 @@ class Game:
             self.vfx.spawn_impact_sparks(ex, ey, color=(255, 220, 100), count=12)
             self.screen_shake.trigger(intensity=4, duration=0.15)
             # Floating label
-            phase_colors = {
-                "OBSERVE": (120, 200, 255),
-                "COUNTER": (255, 200, 80),
-                "DESPERATION": (255, 80, 50),
-                "RAGE": (255, 40, 20),
-            }
-            label_color = phase_colors.get(phase_name, (255, 255, 255))
+            label_color = _PHASE_COLORS.get(phase_name, WHITE)
             self.floating_texts.spawn(
                 f">> {phase_name} <<",
                 int(ex) - 50, int(ey) - 60,
@@ -1035,9 +1166,9 @@ class Game:
             )
 
         # ── Rage mode entry cinematic ─────────────────────
-        if hasattr(ai, 'event_rage_entered') and ai.event_rage_entered:
-            ex = float(self.enemy.rect.centerx)
-            ey = float(self.enemy.rect.centery)
+        if self._ai_has_rage_event and ai.event_rage_entered:
+            ex = float(ecx)
+            ey = float(ecy)
             # Heavy screen shake + slow-mo hint
             self.screen_shake.trigger(intensity=8, duration=0.25)
             # Big burst explosion
@@ -1058,6 +1189,7 @@ class Game:
         self.vfx.update(dt)
 
         # ── Audio update ─────────────────────────────────
+        self.audio.flush()
         player_hp_frac = self.player.hp / max(1, self.player.max_hp)
         self.audio.update(
             dt=raw_dt,
@@ -1103,7 +1235,7 @@ class Game:
             self.time_scale.trigger(scale=PARRY_SLOWMO_SCALE,
                                     duration=PARRY_SLOWMO_DURATION)
             self.impact_flash.trigger(color=CYAN, alpha=100, duration=0.12)
-            self.audio.play_layered(
+            self.audio.queue_layered(
                 ["heavy_hit", "heavy_transient"],
                 x_pos=float(self.player.rect.centerx),
             )
@@ -1130,7 +1262,7 @@ class Game:
                 self.impact_flash.trigger(color=(255, 100, 100), alpha=120,
                                           duration=0.12)
                 self.hit_stop.trigger(0.05)
-                self.audio.play_layered(
+                self.audio.queue_layered(
                     ["heavy_hit", "heavy_transient", "heavy_debris"],
                     x_pos=float(px),
                 )
@@ -1143,21 +1275,21 @@ class Game:
                 self.impact_flash.trigger(color=flash_color, alpha=90,
                                           duration=0.08)
                 self.camera_zoom.punch(1.05, decay=0.05)
-                self.audio.play_sfx("heavy_hit", x_pos=float(px))
+                self.audio.queue_sfx("heavy_hit", x_pos=float(px))
             elif is_duelist_hit:
                 # Duelist quick hit: slightly stronger feedback
                 self.screen_shake.trigger(intensity=4, duration=0.10)
                 self.impact_flash.trigger(color=(255, 220, 180), alpha=70,
                                           duration=0.07)
                 self.hit_stop.trigger(0.03)
-                self.audio.play_sfx("light_hit", x_pos=float(px))
+                self.audio.queue_sfx("light_hit", x_pos=float(px))
             else:
                 self.screen_shake.trigger(intensity=3, duration=0.08)
                 self.impact_flash.trigger(color=(255, 255, 255), alpha=60,
                                           duration=0.06)
-                self.audio.play_sfx("light_hit", x_pos=float(px))
+                self.audio.queue_sfx("light_hit", x_pos=float(px))
 
-            self.audio.play_sfx("health_tick")
+            self.audio.queue_sfx("health_tick")
 
         elif result.blocked:
             self.floating_texts.spawn(
@@ -1172,7 +1304,7 @@ class Game:
             )
             self.screen_shake.trigger(intensity=2, duration=0.06)
             self.hit_stop.trigger(0.02)
-            self.audio.play_sfx("light_hit", x_pos=float(self.player.rect.centerx))
+            self.audio.queue_sfx("light_hit", x_pos=float(self.player.rect.centerx))
             # Block knockback
             if result.block_knockback_vx:
                 self.player.apply_knockback(result.block_knockback_vx)
@@ -1190,6 +1322,7 @@ class Game:
             return
         self.game_over = True
         self.game_state = "GAME_OVER"
+        self._retarget()
         self.winner_text = text
         self.logger.end_match(outcome)
         if self.match_stats:
@@ -1246,6 +1379,7 @@ class Game:
                     self.player = None
                     self.enemy = None
                     self.game_over = False
+                    self._retarget()
 
     def _update_game_over(self):
         """Minimal per-frame update during GAME_OVER (VFX & cinematics only)."""
@@ -1277,7 +1411,7 @@ class Game:
         )
 
     def _draw_game_over_screen(self):
-        """Render the frozen game world with the game-over overlay."""
+        """Render the game world (frozen once settled) with the overlay."""
         self._update_game_over()
         self._draw()
 
@@ -1285,6 +1419,7 @@ class Game:
         """Reset all game variables and start a fresh match."""
         self._reset()
         self.game_state = "PLAYING"
+        self._retarget()
 
     # ── Draw (Solo Mode) ──────────────────────────────────
 
@@ -1294,22 +1429,25 @@ class Game:
             return
         raw_dt = self.clock.get_time() / 1000.0
 
-        world = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        draw_gradient(world)
+        world = self._world
+        if not self._world_frozen:
+            draw_gradient(world)
 
-        # Screen shake offset
-        sx, sy = self.screen_shake.get_offset(raw_dt)
+            # Screen shake offset
+            sx, sy = self.screen_shake.get_offset(raw_dt)
 
-        if sx or sy:
-            shifted = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            draw_gradient(shifted)
-            self._draw_world(shifted, raw_dt)
-            world.blit(shifted, (sx, sy))
-        else:
             self._draw_world(world, raw_dt)
+            if sx or sy:
+                scroll_over_gradient(world, sx, sy)
 
-        # Vignette
-        draw_vignette(world)
+            # Vignette
+            draw_vignette(world)
+
+            # After the match nothing in the world moves once its effects
+            # have played out, so keep that frame instead of repainting it
+            self._world_frozen = (
+                self.game_over and not (sx or sy) and self._world_settled()
+            )
 
         # Camera zoom → blit to screen
         self.camera_zoom.apply(world, self.screen)
@@ -1330,6 +1468,17 @@ class Game:
 
         pygame.display.flip()
 
+    def _world_settled(self) -> bool:
+        """True when _draw_world would paint the same frame from now on."""
+        banner = self.archetype_banner
+        return not (
+            self.screen_shake.active
+            or self.vfx.active
+            or self.floating_texts.active
+            or self.effects.active
+            or (banner is not None and banner.active)
+        ) and health_bars_settled(self.player, self.enemy)
+
     def _draw_world(self, surface, dt: float = 0.016):
         """Draw all game entities, HUD, and VFX onto the given surface."""
         if self.player is None or self.enemy is None:
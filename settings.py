@@ -293,3 +293,4 @@ ENEMY_REGEN_CAP_PCT    = 0.80
 ENEMY_REGEN_IDLE_MS    = 2000
 ENEMY_REGEN_FLASH_DUR  = 0.4
 ENEMY_REGEN_TEXT_DUR   = 1.0
+ENEMY_REGEN_CHECK_DT   = 0.1     # seconds between regen eligibility checks
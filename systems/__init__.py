@@ -1,10 +1,13 @@
 """systems package – Combat, health-bar, stamina, buffs, VFX, PVP, projectiles, character select."""
 
 from .combat_system import CombatSystem, CombatResult
-from .healthbar import draw_health_bars, _clear_cache as clear_healthbar_cache
+from .healthbar import (
+    draw_health_bars, health_bars_settled,
+    _clear_cache as clear_healthbar_cache,
+)
 from .stamina_system import StaminaComponent, StaminaSystem
 from .buff_system import BuffManager, Buff, roll_buff_drop, draw_buff_indicators
-from .vfx_system import VFXSystem, Particle
+from .vfx_system import VFXSystem, ParticleBuffer
 from .pvp_system import PVPManager
 from .projectile_system import ProjectileSystem, Projectile
 from .character_select import CharacterSelectScreen, PLAYER_ROLES, role_to_build_type
@@ -20,6 +20,7 @@ Architecture:
 
 from __future__ import annotations
 
+import functools
 import random
 import math
 import pygame
@@ -276,13 +277,19 @@ def roll_buff_drop() -> Buff | None:
 #  Visual Indicator Drawing
 # ══════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=16)
+def _icon_surface(icon_char: str) -> pygame.Surface:
+    """Rendered buff icon letter (one render per letter)."""
+    return pygame.font.SysFont(None, 16).render(icon_char, True,
+                                                (255, 255, 255))
+
+
 def draw_buff_indicators(surface: pygame.Surface,
                          buff_mgr: BuffManager,
                          x: int, y: int):
     """Draw small colored circles + timer for active buffs."""
     if not buff_mgr.active_buffs:
         return
-    font = pygame.font.SysFont(None, 16)
     bx = x
     for buff in buff_mgr.active_buffs:
         # Pulsing aura circle
@@ -293,8 +300,7 @@ def draw_buff_indicators(surface: pygame.Surface,
         surface.blit(aura_surf, (bx, y))
 
         # Icon letter
-        icon = font.render(buff.icon_char, True, (255, 255, 255))
-        surface.blit(icon, (bx + 4, y + 2))
+        surface.blit(_icon_surface(buff.icon_char), (bx + 4, y + 2))
 
         # Timer bar under icon
         bar_w = int(14 * (1.0 - buff.progress))
@@ -15,7 +15,6 @@ Responsibilities:
 from __future__ import annotations
 
 import logging
-import math
 import time
 
 logger = logging.getLogger(__name__)
@@ -94,8 +93,7 @@ class CombatSystem:
             logger.debug("Hitbox collision confirmed (player → enemy)")
         else:
             # Fallback: simple range check
-            dist = self._distance(player, enemy)
-            if dist > ATTACK_RANGE:
+            if self._distance_sq(player, enemy) > ATTACK_RANGE * ATTACK_RANGE:
                 return result
 
         # Dodge / invulnerability check
@@ -318,11 +316,11 @@ class CombatSystem:
     # ══════════════════════════════════════════════════════
 
     @staticmethod
-    def _distance(a, b) -> float:
-        return math.hypot(
-            a.rect.centerx - b.rect.centerx,
-            a.rect.centery - b.rect.centery,
-        )
+    def _distance_sq(a, b) -> int:
+        """Squared center distance (compare against a squared range)."""
+        dx = a.rect.centerx - b.rect.centerx
+        dy = a.rect.centery - b.rect.centery
+        return dx * dx + dy * dy
 
     def reset(self):
         self._block_start_times.clear()
@@ -1,5 +1,6 @@
 """healthbar.py - Draws smoothly animated health bars for player and enemy."""
 
+import functools
 import pygame
 import random
 from settings import (
@@ -15,27 +16,24 @@ _bar_state: dict[int, dict] = {}
 _LERP_SPEED = 0.08  # interpolation factor per frame
 _SHAKE_DURATION = 0.25  # seconds of bar shake on damage
 _SHAKE_INTENSITY = 3     # pixels
+_RADIUS = 6              # bar corner radius
 
 
 def draw_health_bars(surface, player, enemy, dt: float = 0.016):
     """Render both smoothly-animated health bars at the top of the screen."""
-    font = pygame.font.SysFont(None, SMALL_FONT_SIZE)
-
     # ── Player health bar (left side) ─────────────────────
     _draw_bar(
         surface, PLAYER_HB_X, HEALTHBAR_Y,
         player.hp, player.max_hp, GREEN, id(player), dt,
     )
-    label = font.render("Player", True, WHITE)
-    surface.blit(label, (PLAYER_HB_X, HEALTHBAR_Y - 18))
+    surface.blit(_text_surface("Player"), (PLAYER_HB_X, HEALTHBAR_Y - 18))
 
     # ── Enemy health bar (right side) ─────────────────────
     _draw_bar(
         surface, ENEMY_HB_X, HEALTHBAR_Y,
         enemy.hp, enemy.max_hp, DARK_GREEN, id(enemy), dt,
     )
-    label = font.render("Enemy", True, WHITE)
-    surface.blit(label, (ENEMY_HB_X, HEALTHBAR_Y - 18))
+    surface.blit(_text_surface("Enemy"), (ENEMY_HB_X, HEALTHBAR_Y - 18))
 
 
 def _draw_bar(surface, x, y, current_hp, max_hp, fill_color, entity_id,
@@ -70,44 +68,71 @@ def _draw_bar(surface, x, y, current_hp, max_hp, fill_color, entity_id,
     st["displayed"] += (current_hp - st["displayed"]) * _LERP_SPEED
     displayed = st["displayed"]
 
-    radius = 6  # corner radius
-
     # Subtle glow behind bar
-    glow_surf = pygame.Surface(
-        (HEALTHBAR_WIDTH + 16, HEALTHBAR_HEIGHT + 16), pygame.SRCALPHA,
-    )
     glow_alpha = int(40 * max(0.0, displayed / max_hp))
-    pygame.draw.rect(
-        glow_surf, (*fill_color, glow_alpha),
-        glow_surf.get_rect(), border_radius=radius + 4,
-    )
-    surface.blit(glow_surf, (bx - 8, by - 8))
+    surface.blit(_glow_surface(fill_color, glow_alpha), (bx - 8, by - 8))
 
     # Dark shadow (offset slightly down-right)
     shadow_rect = pygame.Rect(bx + 2, by + 2, HEALTHBAR_WIDTH, HEALTHBAR_HEIGHT)
-    pygame.draw.rect(surface, (15, 15, 15), shadow_rect, border_radius=radius)
+    pygame.draw.rect(surface, (15, 15, 15), shadow_rect, border_radius=_RADIUS)
 
     # Background
     bg_rect = pygame.Rect(bx, by, HEALTHBAR_WIDTH, HEALTHBAR_HEIGHT)
-    pygame.draw.rect(surface, GRAY, bg_rect, border_radius=radius)
+    pygame.draw.rect(surface, GRAY, bg_rect, border_radius=_RADIUS)
 
     # Fill proportional to smoothed HP
     fill_frac = max(0.0, min(1.0, displayed / max_hp))
     fill_width = int(HEALTHBAR_WIDTH * fill_frac)
     if fill_width > 0:
         fill_rect = pygame.Rect(bx, by, fill_width, HEALTHBAR_HEIGHT)
-        pygame.draw.rect(surface, fill_color, fill_rect, border_radius=radius)
+        pygame.draw.rect(surface, fill_color, fill_rect, border_radius=_RADIUS)
 
     # Border
-    pygame.draw.rect(surface, (180, 180, 180), bg_rect, 2, border_radius=radius)
+    pygame.draw.rect(surface, (180, 180, 180), bg_rect, 2, border_radius=_RADIUS)
+
+    # At rest once the fill and glow show the real HP and the shake is over
+    hp_frac = max(0.0, min(1.0, current_hp / max_hp))
+    st["settled"] = (
+        shake_x == 0 and shake_y == 0 and st["shake_timer"] <= 0
+        and fill_width == int(HEALTHBAR_WIDTH * hp_frac)
+        and glow_alpha == int(40 * max(0.0, current_hp / max_hp))
+    )
 
     # HP text centred on bar
-    hp_text = font_small().render(f"{current_hp}/{max_hp}", True, WHITE)
+    hp_text = _text_surface(f"{current_hp}/{max_hp}")
     tx = bx + (HEALTHBAR_WIDTH - hp_text.get_width()) // 2
     ty = by + (HEALTHBAR_HEIGHT - hp_text.get_height()) // 2
     surface.blit(hp_text, (tx, ty))
 
 
+@functools.lru_cache(maxsize=128)
+def _glow_surface(fill_color: tuple, glow_alpha: int) -> pygame.Surface:
+    """Rounded glow plate behind a bar (one per color and alpha)."""
+    glow_surf = pygame.Surface(
+        (HEALTHBAR_WIDTH + 16, HEALTHBAR_HEIGHT + 16), pygame.SRCALPHA,
+    )
+    pygame.draw.rect(
+        glow_surf, (*fill_color, glow_alpha),
+        glow_surf.get_rect(), border_radius=_RADIUS + 4,
+    )
+    return glow_surf
+
+
+@functools.lru_cache(maxsize=64)
+def _text_surface(text: str) -> pygame.Surface:
+    """Rendered label / HP readout (HP only changes on hits)."""
+    return font_small().render(text, True, WHITE)
+
+
+def health_bars_settled(*entities) -> bool:
+    """True once the bars of *entities* will look the same every frame."""
+    for entity in entities:
+        st = _bar_state.get(id(entity))
+        if st is None or not st.get("settled", False):
+            return False
+    return True
+
+
 def _clear_cache():
     """Reset the displayed-HP cache (call on match reset)."""
     _bar_state.clear()
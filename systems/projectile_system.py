@@ -220,10 +220,32 @@ class ProjectileSystem:
     def check_collisions(self, target) -> list[Projectile]:
         """Check all projectiles against a target.
         Returns list of projectiles that hit (already deactivated).
+
+        Same test as ``Projectile.check_collision``, with the per-target
+        checks and rect edges taken once and the per-projectile AABB done
+        on plain numbers (no Rect built per projectile).
         """
         hits: list[Projectile] = []
+        if not self._projectiles:
+            return hits
+        # Skip invulnerable / dodging targets
+        if getattr(target, 'is_invulnerable', False):
+            return hits
+        if getattr(target, 'is_dodging', False):
+            return hits
+        target_id = id(target)
+        trect = target.rect
+        t_left, t_top = trect.left, trect.top
+        t_right, t_bottom = trect.right, trect.bottom
         for proj in self._projectiles:
-            if proj.check_collision(target):
+            if not proj.active or proj.owner_id == target_id:
+                continue
+            r = proj.radius
+            left = int(proj.x - r)
+            top = int(proj.y - r)
+            if (left < t_right and t_left < left + r * 2
+                    and top < t_bottom and t_top < top + r * 2):
+                proj.active = False
                 hits.append(proj)
                 logger.debug("Projectile hit %s! dmg=%d", target.__class__.__name__, proj.damage)
         return hits
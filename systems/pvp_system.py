@@ -262,9 +262,10 @@ class PVPManager:
         results = []
         c1, c2 = self.p1.character, self.p2.character
 
-        # Update animations
-        c1.update_animation(dt)
-        c2.update_animation(dt)
+        # Update animations (idle poses batched across both fighters)
+        c1.update_animation(dt, pose_idle=False)
+        c2.update_animation(dt, pose_idle=False)
+        Character.tick_all_idles((c1, c2))
 
         # Dodge movement
         from settings import DODGE_SPEED
@@ -274,8 +275,8 @@ class PVPManager:
             c2.rect.x += c2.dodge_dir * DODGE_SPEED
 
         # Clamp
-        c1.rect.clamp_ip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
-        c2.rect.clamp_ip(pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        c1.clamp_to_screen()
+        c2.clamp_to_screen()
 
         # Face each other
         c1.face_toward(c2.rect.centerx)
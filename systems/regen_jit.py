@@ -0,0 +1,29 @@
+"""regen_jit.py - Numeric core of enemy HP regeneration.
+
+The time/idle gates stay in ``Enemy._try_regenerate``; once those pass,
+the cap check and heal roll below are pure scalar math and are compiled
+with numba when it is available (see ``utils.jit``).
+"""
+
+from utils.jit import njit, HAS_NUMBA
+
+
+@njit(cache=True)
+def compute_regen(hp: int, cap_hp: int, min_amt: int, max_amt: int,
+                  rand01: float):
+    """Return ``(new_hp, healed)`` for one regeneration attempt.
+
+    *rand01* is a uniform sample in [0, 1) supplied by the caller so the
+    roll stays on Python's ``random`` stream; the heal is drawn uniformly
+    from the integers ``min_amt .. max_amt``.
+    """
+    if hp >= cap_hp:
+        return hp, False
+    heal = min_amt + int(rand01 * (max_amt - min_amt + 1))
+    return min(cap_hp, hp + heal), True
+
+
+def warmup() -> None:
+    """Trigger JIT compilation up front so the first heal doesn't stall."""
+    if HAS_NUMBA:
+        compute_regen(0, 1, 0, 1, 0.5)
@@ -15,8 +15,10 @@ Particles use velocity + gravity + fade for realism.
 
 from __future__ import annotations
 
+import functools
 import math
 import random
+import numpy as np
 import pygame
 from settings import (
     PARTICLE_GRAVITY, PARTICLE_MAX_COUNT,
@@ -24,71 +26,142 @@ from settings import (
     TRAIL_SEGMENT_LIFETIME, AURA_PARTICLE_COUNT,
     SCREEN_WIDTH, SCREEN_HEIGHT,
 )
+from systems._particle_math import step_particles
+
+# Most expired trails / flashes kept for reuse
+_POOL_MAX = 64
 
 
 # ══════════════════════════════════════════════════════════
-#  Base Particle
+#  Particles
 # ══════════════════════════════════════════════════════════
 
-class Particle:
-    """Physics-based particle with velocity, gravity, and fade."""
+@functools.lru_cache(maxsize=256)
+def _dot_sprite(rgb: tuple, sz: int) -> pygame.Surface:
+    """Opaque *rgb* circle of radius *sz* on a transparent square."""
+    ps = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
+    pygame.draw.circle(ps, rgb, (sz, sz), sz)
+    return ps
+
+
+class ParticleBuffer:
+    """Physics-based particles with velocity, gravity, and fade.
+
+    Stored structure-of-arrays: one NumPy array per attribute, with the
+    live particles packed into indices ``[0, count)`` in spawn order.
+    ``update`` steps them all in one call (``step_particles``) and then
+    compacts out the dead ones.  When full, adding drops the oldest: the
+    arrays have room for a second *capacity* of spawns, and the overflow
+    is evicted in one slice per array by ``_trim`` (once per burst).
+    """
 
     __slots__ = (
-        "x", "y", "vx", "vy", "color", "size",
-        "lifetime", "timer", "gravity", "fade",
-        "shrink", "drag",
+        "capacity", "count",
+        "x", "y", "vx", "vy", "size", "lifetime", "timer",
+        "gravity", "drag", "fade", "shrink", "colors", "_fields",
     )
 
-    def __init__(self, x: float, y: float, vx: float, vy: float,
-                 color: tuple, size: float = 3.0,
-                 lifetime: float = 0.8, gravity: float = PARTICLE_GRAVITY,
-                 fade: bool = True, shrink: bool = True,
-                 drag: float = 0.98):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.size = size
-        self.lifetime = lifetime
-        self.timer = lifetime
-        self.gravity = gravity
-        self.fade = fade
-        self.shrink = shrink
-        self.drag = drag
-
-    @property
-    def alive(self) -> bool:
-        return self.timer > 0 and self.size > 0.2
+    def __init__(self, capacity: int = PARTICLE_MAX_COUNT):
+        self.capacity = capacity
+        self.count = 0
+        room = 2 * capacity
+        self.x = np.zeros(room)
+        self.y = np.zeros(room)
+        self.vx = np.zeros(room)
+        self.vy = np.zeros(room)
+        self.size = np.zeros(room)
+        self.lifetime = np.zeros(room)
+        self.timer = np.zeros(room)
+        self.gravity = np.zeros(room)
+        self.drag = np.zeros(room)
+        self.fade = np.zeros(room, dtype=np.bool_)
+        self.shrink = np.zeros(room, dtype=np.bool_)
+        self.colors: list[tuple] = []
+        self._fields = (
+            self.x, self.y, self.vx, self.vy, self.size, self.lifetime,
+            self.timer, self.gravity, self.drag, self.fade, self.shrink,
+        )
 
-    @property
-    def progress(self) -> float:
-        return 1.0 - max(0.0, self.timer / self.lifetime)
+    def add(self, x: float, y: float, vx: float, vy: float,
+            color: tuple, size: float = 3.0,
+            lifetime: float = 0.8, gravity: float = PARTICLE_GRAVITY,
+            fade: bool = True, shrink: bool = True,
+            drag: float = 0.98):
+        i = self.count
+        if i == len(self.x):
+            self._trim()
+            i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.size[i] = size
+        self.lifetime[i] = lifetime
+        self.timer[i] = lifetime
+        self.gravity[i] = gravity
+        self.drag[i] = drag
+        self.fade[i] = fade
+        self.shrink[i] = shrink
+        self.colors.append(color)
+        self.count = i + 1
+
+    def _trim(self):
+        """Drop the oldest particles beyond *capacity* in one slice."""
+        drop = self.count - self.capacity
+        if drop <= 0:
+            return
+        keep = self.capacity
+        for arr in self._fields:
+            arr[:keep] = arr[drop:drop + keep]
+        del self.colors[:drop]
+        self.count = keep
 
     def update(self, dt: float):
-        self.timer -= dt
-        # Physics
-        self.vy += self.gravity * dt
-        self.vx *= self.drag
-        self.vy *= self.drag
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        # Shrink
-        if self.shrink:
-            self.size = max(0.0, self.size * (1.0 - dt * 2.5))
+        self._trim()
+        n = self.count
+        if n == 0:
+            return
+        keep = step_particles(
+            self.x, self.y, self.vx, self.vy, self.size, self.timer,
+            self.gravity, self.drag, self.shrink, n, dt,
+        )
+        m = len(keep)
+        if m < n:
+            for arr in self._fields:
+                arr[:m] = arr[keep]
+            colors = self.colors
+            self.colors = [colors[i] for i in keep]
+            self.count = m
 
     def draw(self, surface: pygame.Surface):
-        if not self.alive:
+        self._trim()
+        n = self.count
+        if n == 0:
             return
-        alpha = 255
-        if self.fade:
-            alpha = int(255 * max(0.0, self.timer / self.lifetime))
-        sz = max(1, int(self.size))
-        # Use a small surface for alpha support
-        ps = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
-        c = (*self.color[:3], min(255, alpha))
-        pygame.draw.circle(ps, c, (sz, sz), sz)
-        surface.blit(ps, (int(self.x) - sz, int(self.y) - sz))
+        # One conversion per attribute instead of per-element NumPy access
+        xs = self.x[:n].tolist()
+        ys = self.y[:n].tolist()
+        sizes = self.size[:n].tolist()
+        timers = self.timer[:n].tolist()
+        lifetimes = self.lifetime[:n].tolist()
+        fades = self.fade[:n].tolist()
+        for i, color in enumerate(self.colors):
+            timer = timers[i]
+            size = sizes[i]
+            if timer <= 0 or size <= 0.2:
+                continue
+            alpha = 255
+            if fades[i]:
+                alpha = int(255 * max(0.0, timer / lifetimes[i]))
+            sz = max(1, int(size))
+            # Shared pre-rendered dot, faded via its surface alpha
+            ps = _dot_sprite(color[:3], sz)
+            ps.set_alpha(min(255, alpha))
+            surface.blit(ps, (int(xs[i]) - sz, int(ys[i]) - sz))
+
+    def clear(self):
+        self.count = 0
+        self.colors.clear()
 
 
 # ══════════════════════════════════════════════════════════
@@ -104,6 +177,12 @@ class TrailSegment:
     def __init__(self, x1: float, y1: float, x2: float, y2: float,
                  color: tuple, width: int = 3,
                  lifetime: float = TRAIL_SEGMENT_LIFETIME):
+        self.reset(x1, y1, x2, y2, color, width, lifetime)
+
+    def reset(self, x1: float, y1: float, x2: float, y2: float,
+              color: tuple, width: int = 3,
+              lifetime: float = TRAIL_SEGMENT_LIFETIME):
+        """Re-initialise in place (used when recycled from the pool)."""
         self.x1, self.y1 = x1, y1
         self.x2, self.y2 = x2, y2
         self.color = color
@@ -124,14 +203,29 @@ class TrailSegment:
         frac = max(0.0, self.timer / self.lifetime)
         alpha = int(200 * frac)
         w = max(1, int(self.width * frac))
-        trail_surf = pygame.Surface(
-            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA,
-        )
         c = (*self.color[:3], alpha)
-        pygame.draw.line(trail_surf, c,
-                         (int(self.x1), int(self.y1)),
-                         (int(self.x2), int(self.y2)), w)
-        surface.blit(trail_surf, (0, 0))
+        x1, y1 = int(self.x1), int(self.y1)
+        x2, y2 = int(self.x2), int(self.y2)
+        if (0 <= x1 < SCREEN_WIDTH and 0 <= x2 < SCREEN_WIDTH
+                and 0 <= y1 < SCREEN_HEIGHT and 0 <= y2 < SCREEN_HEIGHT):
+            # On screen: an alpha surface just around the segment is enough
+            pad = w + 2
+            left = min(x1, x2) - pad
+            top = min(y1, y2) - pad
+            trail_surf = pygame.Surface(
+                (abs(x2 - x1) + pad * 2 + 1, abs(y2 - y1) + pad * 2 + 1),
+                pygame.SRCALPHA,
+            )
+            pygame.draw.line(trail_surf, c,
+                             (x1 - left, y1 - top), (x2 - left, y2 - top), w)
+            surface.blit(trail_surf, (left, top))
+        else:
+            # Clipped at the screen edge: keep the full-screen clip
+            trail_surf = pygame.Surface(
+                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA,
+            )
+            pygame.draw.line(trail_surf, c, (x1, y1), (x2, y2), w)
+            surface.blit(trail_surf, (0, 0))
 
 
 # ══════════════════════════════════════════════════════════
@@ -145,9 +239,12 @@ class VFXSystem:
     """
 
     def __init__(self):
-        self._particles: list[Particle] = []
+        self._particles = ParticleBuffer()
         self._trails: list[TrailSegment] = []
         self._flashes: list[_ImpactFlashParticle] = []
+        # Expired trails / flashes, recycled by the spawners
+        self._free_trails: list[TrailSegment] = []
+        self._free_flashes: list[_ImpactFlashParticle] = []
 
     # ── Spawners ──────────────────────────────────────────
 
@@ -164,10 +261,10 @@ class VFXSystem:
             ])
             size = random.uniform(1.5, 4.0)
             lifetime = random.uniform(0.3, 0.8)
-            self._add_particle(Particle(
+            self._particles.add(
                 x, y, vx, vy, color, size, lifetime,
                 gravity=PARTICLE_GRAVITY * 0.8, drag=0.96,
-            ))
+            )
 
     def spawn_impact_sparks(self, x: float, y: float,
                             color: tuple = (255, 220, 80),
@@ -180,31 +277,37 @@ class VFXSystem:
             vy = math.sin(angle) * speed
             size = random.uniform(1.0, 2.5)
             lifetime = random.uniform(0.15, 0.35)
-            self._add_particle(Particle(
+            self._particles.add(
                 x, y, vx, vy, color, size, lifetime,
                 gravity=PARTICLE_GRAVITY * 0.3, drag=0.92,
-            ))
+            )
 
     def spawn_parry_flash(self, x: float, y: float):
         """Large bright flash + ring + sparks for perfect parry."""
         # Central flash
-        self._flashes.append(_ImpactFlashParticle(x, y, (255, 255, 200), 40, 0.25))
+        self._spawn_flash(x, y, (255, 255, 200), 40, 0.25)
         # Ring of sparks
         for i in range(16):
             angle = (math.pi * 2 / 16) * i
             speed = random.uniform(150, 300)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
-            self._add_particle(Particle(
+            self._particles.add(
                 x, y, vx, vy, (255, 255, 180), 2.5, 0.3,
                 gravity=0, drag=0.90,
-            ))
+            )
 
     def spawn_weapon_trail(self, x1: float, y1: float,
                            x2: float, y2: float,
                            color: tuple = (200, 210, 230)):
         """Add a weapon trail segment."""
-        self._trails.append(TrailSegment(x1, y1, x2, y2, color, width=3))
+        free = self._free_trails
+        if free:
+            trail = free.pop()
+            trail.reset(x1, y1, x2, y2, color, width=3)
+        else:
+            trail = TrailSegment(x1, y1, x2, y2, color, width=3)
+        self._trails.append(trail)
 
     def spawn_aura_particles(self, cx: float, cy: float,
                              color: tuple, count: int = 3,
@@ -219,15 +322,15 @@ class VFXSystem:
             vy = random.uniform(-60, -20)
             size = random.uniform(1.0, 2.5)
             lifetime = random.uniform(0.4, 0.8)
-            self._add_particle(Particle(
+            self._particles.add(
                 px, py, vx, vy, color, size, lifetime,
                 gravity=-20, drag=0.97,
-            ))
+            )
 
     def spawn_execution_burst(self, x: float, y: float):
         """Dramatic burst for execution finisher."""
         # Large central flash
-        self._flashes.append(_ImpactFlashParticle(x, y, (255, 80, 40), 60, 0.4))
+        self._spawn_flash(x, y, (255, 80, 40), 60, 0.4)
         # Explosion of particles
         for _ in range(30):
             angle = random.uniform(0, math.pi * 2)
@@ -239,10 +342,10 @@ class VFXSystem:
             ])
             size = random.uniform(2.0, 5.0)
             lifetime = random.uniform(0.3, 0.7)
-            self._add_particle(Particle(
+            self._particles.add(
                 x, y, vx, vy, color, size, lifetime,
                 gravity=PARTICLE_GRAVITY * 0.5, drag=0.94,
-            ))
+            )
 
     def spawn_stagger_debris(self, x: float, y: float, direction: int = 1):
         """Small debris particles on stagger knockback."""
@@ -252,10 +355,10 @@ class VFXSystem:
             color = random.choice([
                 (160, 160, 160), (120, 120, 120), (100, 90, 80),
             ])
-            self._add_particle(Particle(
+            self._particles.add(
                 x, y, vx, vy, color, random.uniform(1.0, 2.5), 0.4,
                 gravity=PARTICLE_GRAVITY, drag=0.95,
-            ))
+            )
 
     def spawn_death_particles(self, x: float, y: float, color: tuple):
         """Dramatic death particle spray."""
@@ -268,10 +371,10 @@ class VFXSystem:
             lifetime = random.uniform(0.5, 1.2)
             brightness = random.uniform(0.5, 1.0)
             pc = tuple(int(c * brightness) for c in color[:3])
-            self._add_particle(Particle(
+            self._particles.add(
                 x, y, vx, vy, pc, size, lifetime,
                 gravity=PARTICLE_GRAVITY * 0.6, drag=0.95,
-            ))
+            )
 
     def spawn_heal_sparkle(self, x: float, y: float, count: int = 6):
         """Green sparkles for healing / regen."""
@@ -281,17 +384,17 @@ class VFXSystem:
             color = random.choice([
                 (80, 255, 80), (60, 220, 60), (100, 255, 120),
             ])
-            self._add_particle(Particle(
+            self._particles.add(
                 x + random.uniform(-12, 12), y,
                 vx, vy, color, random.uniform(1.5, 3.0), 0.6,
                 gravity=-40, drag=0.97,
-            ))
+            )
 
     def spawn_magic_impact(self, x: float, y: float,
                            color: tuple = (180, 120, 255)):
         """Purple magic burst when a projectile hits."""
         # Central flash
-        self._flashes.append(_ImpactFlashParticle(x, y, color, 30, 0.2))
+        self._spawn_flash(x, y, color, 30, 0.2)
         # Scattered sparks
         for _ in range(14):
             angle = random.uniform(0, math.pi * 2)
@@ -303,44 +406,57 @@ class VFXSystem:
                 min(255, color[1] + random.randint(-30, 30)),
                 min(255, color[2] + random.randint(-30, 30)),
             )
-            self._add_particle(Particle(
+            self._particles.add(
                 x, y, vx, vy, c, random.uniform(1.5, 3.5), 0.35,
                 gravity=PARTICLE_GRAVITY * 0.3, drag=0.92,
-            ))
+            )
 
     def spawn_hit_flash(self, x: float, y: float,
                         color: tuple = (255, 60, 60)):
         """Short red flash on the character when hit (damage feedback)."""
-        self._flashes.append(_ImpactFlashParticle(x, y, color, 20, 0.12))
+        self._spawn_flash(x, y, color, 20, 0.12)
 
     # ── Internal ──────────────────────────────────────────
 
-    def _add_particle(self, p: Particle):
-        self._particles.append(p)
-        # Enforce max count
-        if len(self._particles) > PARTICLE_MAX_COUNT:
-            self._particles = self._particles[-PARTICLE_MAX_COUNT:]
+    def _spawn_flash(self, x: float, y: float, color: tuple,
+                     max_radius: float, lifetime: float):
+        free = self._free_flashes
+        if free:
+            flash = free.pop()
+            flash.reset(x, y, color, max_radius, lifetime)
+        else:
+            flash = _ImpactFlashParticle(x, y, color, max_radius, lifetime)
+        self._flashes.append(flash)
+
+    @staticmethod
+    def _step_pooled(items: list, free: list, dt: float) -> list:
+        """Update *items*; return the live ones and recycle the rest."""
+        live = []
+        for item in items:
+            item.update(dt)
+            if item.alive:
+                live.append(item)
+            elif len(free) < _POOL_MAX:
+                free.append(item)
+        return live
 
     # ── Per-frame ─────────────────────────────────────────
 
     def update(self, dt: float):
-        for p in self._particles:
-            p.update(dt)
-        self._particles = [p for p in self._particles if p.alive]
+        self._particles.update(dt)
 
-        for t in self._trails:
-            t.update(dt)
-        self._trails = [t for t in self._trails if t.alive]
+        self._trails = self._step_pooled(self._trails, self._free_trails, dt)
+        self._flashes = self._step_pooled(self._flashes, self._free_flashes, dt)
 
-        for f in self._flashes:
-            f.update(dt)
-        self._flashes = [f for f in self._flashes if f.alive]
+    @property
+    def active(self) -> bool:
+        """True while any particle, trail or flash is still alive."""
+        return bool(self._particles.count or self._trails or self._flashes)
 
     def draw(self, surface: pygame.Surface):
         for t in self._trails:
             t.draw(surface)
-        for p in self._particles:
-            p.draw(surface)
+        self._particles.draw(surface)
         for f in self._flashes:
             f.draw(surface)
 
@@ -361,6 +477,11 @@ class _ImpactFlashParticle:
 
     def __init__(self, x: float, y: float, color: tuple,
                  max_radius: float, lifetime: float):
+        self.reset(x, y, color, max_radius, lifetime)
+
+    def reset(self, x: float, y: float, color: tuple,
+              max_radius: float, lifetime: float):
+        """Re-initialise in place (used when recycled from the pool)."""
         self.x = x
         self.y = y
         self.color = color
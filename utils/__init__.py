@@ -2,7 +2,7 @@
 
 from .helpers import draw_text, draw_end_screen
 from .vfx import (
-    draw_gradient, draw_glow,
+    draw_gradient, scroll_over_gradient, draw_glow,
     ScreenShake, FloatingTextManager, EffectsManager,
     TimeScaleManager, HitStop, CameraZoom, ImpactFlash,
     ComboCounter, draw_vignette, FinalHitCinematic, ArchetypeBanner,
@@ -0,0 +1,18 @@
+"""jit.py - Optional numba JIT decorator.
+
+``numba`` is not a hard dependency.  Modules with hot scalar/array math
+decorate it with ``@njit(cache=True)`` from here: with numba installed
+the function is compiled, otherwise it runs unchanged as plain Python.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*_args, **_kwargs):
+        """No-op stand-in for ``numba.njit(...)`` when numba is missing."""
+        def wrap(fn):
+            return fn
+        return wrap
@@ -5,6 +5,7 @@ All effects are drawn programmatically (no sprites / PNGs).
 This module is rendering-only — it never touches game logic.
 """
 
+import functools
 import pygame
 import random
 import math
@@ -24,17 +25,38 @@ def draw_gradient(surface, top_color=(25, 30, 40), bottom_color=(10, 10, 15)):
     w, h = surface.get_width(), surface.get_height()
 
     if _gradient_cache is None or _gradient_cache.get_size() != (w, h):
-        _gradient_cache = pygame.Surface((w, h))
+        grad = pygame.Surface((w, h))
         for y in range(h):
             ratio = y / h
             r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
             g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
             b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-            pygame.draw.line(_gradient_cache, (r, g, b), (0, y), (w, y))
+            pygame.draw.line(grad, (r, g, b), (0, y), (w, y))
+        # Match the display's pixel format so the per-frame blit is a copy
+        if pygame.display.get_surface() is not None:
+            grad = grad.convert()
+        _gradient_cache = grad
 
     surface.blit(_gradient_cache, (0, 0))
 
 
+def scroll_over_gradient(surface, dx: int, dy: int):
+    """Shift *surface* by (dx, dy) in place and refill the exposed edges
+    from the gradient last drawn by :func:`draw_gradient`.
+
+    Same result as drawing the content onto a fresh gradient at an
+    offset, without a second full-screen surface.
+    """
+    surface.scroll(dx, dy)
+    w, h = surface.get_size()
+    if dx:
+        strip = pygame.Rect(0 if dx > 0 else w + dx, 0, abs(dx), h)
+        surface.blit(_gradient_cache, strip, strip)
+    if dy:
+        strip = pygame.Rect(0, 0 if dy > 0 else h + dy, w, abs(dy))
+        surface.blit(_gradient_cache, strip, strip)
+
+
 # ==============================================================
 #  Glow Effect
 # ==============================================================
@@ -77,6 +99,10 @@ class ScreenShake:
         self._intensity = intensity
         self._timer = duration
 
+    @property
+    def active(self) -> bool:
+        return self._timer > 0
+
     def get_offset(self, dt: float) -> tuple[int, int]:
         """Return (dx, dy) offset for this frame and tick down."""
         if self._timer <= 0:
@@ -142,6 +168,10 @@ class FloatingTextManager:
             t.update(dt)
         self._texts = [t for t in self._texts if t.alive]
 
+    @property
+    def active(self) -> bool:
+        return bool(self._texts)
+
     def draw(self, surface):
         for t in self._texts:
             t.draw(surface)
@@ -200,6 +230,10 @@ class EffectsManager:
             e.update(dt)
         self._effects = [e for e in self._effects if e.alive]
 
+    @property
+    def active(self) -> bool:
+        return bool(self._effects)
+
     def draw(self, surface):
         for e in self._effects:
             e.draw(surface)
@@ -425,16 +459,21 @@ class ComboCounter:
 # ==============================================================
 
 _vignette_cache: pygame.Surface | None = None
+_vignette_key: tuple = ()
+# (surface, dest, area) strips of the cache that hold any darkening; the
+# centre is fully transparent, so it is never blended
+_vignette_blits: list = []
 
 
 def draw_vignette(surface: pygame.Surface, strength: int = 70):
     """Draw a radial vignette (dark edges) over the screen.  Cached."""
-    global _vignette_cache
+    global _vignette_cache, _vignette_key, _vignette_blits
     w, h = surface.get_size()
-    if _vignette_cache is None or _vignette_cache.get_size() != (w, h):
+    if _vignette_key != (w, h, strength):
         _vignette_cache = pygame.Surface((w, h), pygame.SRCALPHA)
         cx, cy = w // 2, h // 2
         max_dist = math.hypot(cx, cy)
+        hole = None
         # Build with concentric rectangles for speed
         for ring in range(0, int(max_dist), 4):
             frac = ring / max_dist
@@ -443,9 +482,33 @@ def draw_vignette(surface: pygame.Surface, strength: int = 70):
                 continue
             alpha = int(strength * ((frac - 0.55) / 0.45) ** 1.5)
             alpha = min(alpha, strength)
+            if alpha > 0 and hole is None:
+                # Inside of the first visible (4 px wide) ring
+                hole = pygame.Rect(cx - ring + 4, cy - ring + 4,
+                                   ring * 2 - 8, ring * 2 - 8)
             rect = pygame.Rect(cx - ring, cy - ring, ring * 2, ring * 2)
             pygame.draw.rect(_vignette_cache, (0, 0, 0, alpha), rect, 4)
-    surface.blit(_vignette_cache, (0, 0))
+
+        full = pygame.Rect(0, 0, w, h)
+        if hole is None:
+            strips = []
+        else:
+            hole = hole.clip(full)
+            if not hole.width or not hole.height:
+                strips = [full]
+            else:
+                strips = [
+                    pygame.Rect(0, 0, w, hole.top),
+                    pygame.Rect(0, hole.bottom, w, h - hole.bottom),
+                    pygame.Rect(0, hole.top, hole.left, hole.height),
+                    pygame.Rect(hole.right, hole.top, w - hole.right, hole.height),
+                ]
+        _vignette_blits = [
+            (_vignette_cache, r.topleft, r)
+            for r in strips if r.width > 0 and r.height > 0
+        ]
+        _vignette_key = (w, h, strength)
+    surface.blits(_vignette_blits, doreturn=False)
 
 
 # ==============================================================
@@ -512,6 +575,16 @@ class FinalHitCinematic:
 #  Archetype Fade-In Text
 # ==============================================================
 
+@functools.lru_cache(maxsize=16)
+def _banner_surface(text: str) -> pygame.Surface:
+    """Rendered banner text, shared by every banner showing *text*."""
+    font = pygame.font.SysFont(None, 36, bold=True)
+    txt = font.render(text, True, (200, 200, 255))
+    surf = pygame.Surface(txt.get_size(), pygame.SRCALPHA)
+    surf.blit(txt, (0, 0))
+    return surf
+
+
 class ArchetypeBanner:
     """Show 'Enemy Archetype: X' that fades out over 2 seconds."""
 
@@ -534,11 +607,8 @@ class ArchetypeBanner:
         frac = self._timer / self._duration
         alpha = int(255 * min(1.0, frac * 2))  # full alpha first half, fade second
 
-        font = pygame.font.SysFont(None, 36, bold=True)
-        txt = font.render(self._text, True, (200, 200, 255))
-        alpha_surf = pygame.Surface(txt.get_size(), pygame.SRCALPHA)
-        alpha_surf.blit(txt, (0, 0))
-        alpha_surf.set_alpha(alpha)
+        txt = _banner_surface(self._text)
+        txt.set_alpha(alpha)
 
         cx = surface.get_width() // 2 - txt.get_width() // 2
-        surface.blit(alpha_surf, (cx, 70))
+        surface.blit(txt, (cx, 70))